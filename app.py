@@ -16,18 +16,16 @@ if project_root not in sys.path:
 def setup_environment():
     """设置运行环境"""
     try:
-        # 创建必要的目录
+        # 创建必要的目录 (makedirs 会一并创建父目录)
         required_dirs = [
             'logs',
-            'resources',
             'resources/icons',
             'resources/styles',
             'auto_saves'
         ]
         
         for directory in required_dirs:
-            if not os.path.exists(directory):
-                os.makedirs(directory)
+            os.makedirs(directory, exist_ok=True)
                 
         # 设置应用程序信息
         QApplication.setApplicationName("文件夹大小扫描器")
@@ -64,10 +62,16 @@ def check_resources():
         ]
         
         icon_dir = "resources/icons"
-        missing_icons = [
-            icon for icon in required_icons 
-            if not os.path.exists(f"{icon_dir}/{icon}.png")
-        ]
+        try:
+            # 一次读取图标目录, 避免逐个 stat
+            with os.scandir(icon_dir) as it:
+                present = {e.name[:-4] for e in it if e.name.endswith('.png')}
+            missing_icons = [icon for icon in required_icons if icon not in present]
+        except FileNotFoundError:
+            missing_icons = [
+                icon for icon in required_icons 
+                if not os.path.exists(f"{icon_dir}/{icon}.png")
+            ]
         
         if missing_icons:
             print(f"Warning: Missing icons: {', '.join(missing_icons)}")
@@ -89,9 +93,11 @@ def main():
         
         # 初始化配置管理器
         config = ConfigManager()
+        app.aboutToQuit.connect(config.save_config)
         
         # 初始化日志管理器
-        LogManager()
+        log_manager = LogManager()
+        app.aboutToQuit.connect(log_manager.stop)
         
         # 创建并显示主窗口
         window = MainWindow(config)
@@ -1,17 +1,57 @@
-from dataclasses import dataclass
 from typing import Optional
 import os
+from utils.formatters import format_size
 
-@dataclass
 class FileItem:
     """文件项数据类"""
-    name: str
-    path: str
-    is_directory: bool = True
-    size: Optional[int] = None
-    file_count: Optional[int] = 0
-    status: str = "未计算"
-    checked: bool = False
+
+    __slots__ = (
+        'name', 'path', 'is_directory', '_size', 'file_count',
+        'status', 'checked', '_formatted_size'
+    )
+
+    def __init__(
+        self,
+        name: str,
+        path: str,
+        is_directory: bool = True,
+        size: Optional[int] = None,
+        file_count: Optional[int] = 0,
+        status: str = "未计算",
+        checked: bool = False
+    ):
+        self.name = name
+        self.path = path
+        self.is_directory = is_directory
+        self._size = size
+        self.file_count = file_count
+        self.status = status
+        self.checked = checked
+        self._formatted_size: Optional[str] = None  # format_size() 的缓存结果
+
+    @property
+    def size(self) -> Optional[int]:
+        return self._size
+
+    @size.setter
+    def size(self, value: Optional[int]):
+        self._size = value
+        self._formatted_size = None
+
+    def __repr__(self) -> str:
+        return (
+            f"FileItem(name={self.name!r}, path={self.path!r}, "
+            f"is_directory={self.is_directory!r}, size={self._size!r}, "
+            f"file_count={self.file_count!r}, status={self.status!r}, "
+            f"checked={self.checked!r})"
+        )
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
 
     def to_dict(self) -> dict:
         """转换为字典格式"""
@@ -32,15 +72,11 @@ class FileItem:
 
     def format_size(self) -> str:
         """格式化大小显示"""
+        if self._formatted_size is not None:
+            return self._formatted_size
+            
         if self.size is None:
             return "未计算"
             
-        units = ['B', 'KB', 'MB', 'GB', 'TB']
-        size = float(self.size)
-        unit_index = 0
-        
-        while size >= 1024 and unit_index < len(units) - 1:
-            size /= 1024
-            unit_index += 1
-            
-        return f"{size:.2f} {units[unit_index]}" 
\ No newline at end of file
+        self._formatted_size = format_size(self.size)
+        return self._formatted_size
@@ -1,21 +1,115 @@
 import os
+import sys
+import errno
+import json
 import shutil
 import logging
-from typing import Generator, Optional, Callable, List
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Generator, Iterator, Optional, Callable, List, Tuple
 from models.file_item import FileItem
+from services.parallel_copy import PipelinedCopy
 from utils.config_manager import ConfigManager
 
+# 默认并发遍历线程数
+DEFAULT_SCAN_THREADS = 16
+WALK_WAIT_TIMEOUT = 0.1  # 秒, 空闲遍历线程检查停止请求的间隔
+WALK_PARALLEL_MIN = 8  # 待处理目录达到该数量后才交给遍历线程池, 小目录树在调用线程中直接遍历
+
+# POSIX 下可以对目录文件描述符调用 scandir, 条目的 stat 相对该描述符解析
+# (fstatat), 与 os.fwalk 相同, 无需为每个文件重新解析完整路径
+_SCANDIR_DIR_FD = os.scandir in os.supports_fd
+_O_DIRECTORY = os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0)
+
+# 文件复制
+COPY_CHUNK_SIZE = 4 << 20  # 内核态复制每块 4 MiB
+COPY_BUFSIZE = getattr(shutil, 'COPY_BUFSIZE', 1024 * 1024)  # 回退读写缓冲区
+_O_BINARY = getattr(os, 'O_BINARY', 0)
+# 只有 Linux 的 sendfile 支持普通文件之间复制; macOS/BSD 的目标必须是套接字, 且参数不同
+_SENDFILE_FILES = sys.platform.startswith('linux') and hasattr(os, 'sendfile')
+PIPELINE_MIN_SIZE = 4 * COPY_BUFSIZE  # 回退读写时, 达到该大小的文件用读写重叠复制 (配置项 pipelined_copy)
+PROGRESS_MIN_BYTES = 1 << 20  # 两次进度回调之间至少复制 1 MiB
+PROGRESS_MIN_INTERVAL = 0.033  # 或至少间隔约 33ms (~30Hz)
+# 内核复制不支持当前文件组合时 (如跨文件系统、目标不是套接字) 回退到下一种方式
+_COPY_FALLBACK_ERRNOS = {
+    code for code in (
+        getattr(errno, name, None)
+        for name in ('ENOSYS', 'EXDEV', 'EINVAL', 'ENOTSUP', 'EOPNOTSUPP', 'ENOTSOCK')
+    ) if code is not None
+}
+
+# 目录大小缓存
+SIZE_CACHE_FILE = os.path.join('auto_saves', 'size_cache.json')
+DEFAULT_SIZE_CACHE_MAX = 100000
+
+@contextmanager
+def _scandir_dir(path: str) -> Iterator[Iterator[os.DirEntry]]:
+    """打开目录并返回 scandir 迭代器, 支持时基于目录文件描述符"""
+    if not _SCANDIR_DIR_FD:
+        with os.scandir(path) as it:
+            yield it
+        return
+        
+    fd = os.open(path, _O_DIRECTORY)
+    try:
+        with os.scandir(fd) as it:
+            yield it
+    finally:
+        os.close(fd)
+
+def _is_size_cache_entry(entry) -> bool:
+    """检查缓存文件中的一条记录: [路径, mtime_ns, inode, 大小, 文件数, 子目录列表]"""
+    if not isinstance(entry, list) or len(entry) != 6:
+        return False
+    path, mtime_ns, ino, size, count, subdirs = entry
+    return (isinstance(path, str)
+            and all(type(value) is int for value in (mtime_ns, ino, size, count))
+            and isinstance(subdirs, list)
+            and all(isinstance(subdir, str) for subdir in subdirs))
+
 class FileScanner:
     """文件扫描器类"""
     
-    def __init__(self, config: ConfigManager):
+    def __init__(self, config: ConfigManager, stop_event: Optional[threading.Event] = None):
         self.config = config
         self.logger = logging.getLogger(__name__)
-        self.stopped = False
+        # 停止请求, 可与工作线程共享; 遍历和复制的内层循环都会检查。
+        # 由发起操作的线程在开始前清除, 工作线程只读取, 避免清除掉刚发出的停止请求
+        self.stop_event = stop_event if stop_event is not None else threading.Event()
         
+        # 目录大小缓存: (绝对路径, mtime_ns, inode) -> (文件大小, 文件数, 子目录绝对路径列表)
+        # 已有文件的原地修改不会改变目录 mtime, 缓存可能给出过期大小, 因此默认关闭 (配置项 size_cache_enabled)
+        self.size_cache_enabled = bool(self.config.get_setting('size_cache_enabled', False))
+        self._size_cache_file = self.config.get_setting('size_cache_file', SIZE_CACHE_FILE)
+        self._size_cache_max = int(self.config.get_setting('size_cache_max', DEFAULT_SIZE_CACHE_MAX))
+        self._size_cache_lock = threading.Lock()
+        self._size_cache_save_lock = threading.Lock()  # 串行化缓存文件写出
+        self._size_cache_dirty = False
+        self._size_cache: Optional[OrderedDict] = None  # 首次使用时在工作线程中加载
+        
+        # 遍历线程池在各次计算之间复用, 首次需要并行遍历时创建
+        self._walk_executor: Optional[ThreadPoolExecutor] = None
+        self._walk_executor_workers = 0
+        self._walk_executor_lock = threading.Lock()
+        
+    @property
+    def stopped(self) -> bool:
+        """是否已请求停止"""
+        return self.stop_event.is_set()
+        
+    @stopped.setter
+    def stopped(self, value: bool):
+        if value:
+            self.stop_event.set()
+        else:
+            self.stop_event.clear()
+            
     def stop(self):
         """停止扫描"""
-        self.stopped = True
+        self.stop_event.set()
         
     def scan_directory(self, path: str) -> Generator[FileItem, None, None]:
         """扫描目录
@@ -27,24 +121,23 @@ class FileScanner:
             FileItem: 扫描到的文件项
         """
         try:
-            self.stopped = False
-            
-            # 遍历目录
-            for entry in os.scandir(path):
-                if self.stopped:
-                    break
-                    
-                if entry.is_dir():
+            # 只在 with 块内收集目录项, 尽早释放目录句柄
+            entries = []
+            with os.scandir(path) as it:
+                for entry in it:
+                    if self.stop_event.is_set():
+                        break
                     try:
-                        item = FileItem(
-                            name=entry.name,
-                            path=entry.path,
-                            is_directory=True
-                        )
-                        yield item
-                    except Exception as e:
+                        if entry.is_dir(follow_symlinks=False):
+                            entries.append((entry.name, entry.path))
+                    except OSError as e:
                         self.logger.error(f"Error scanning {entry.path}: {str(e)}")
                         
+            for name, entry_path in entries:
+                if self.stop_event.is_set():
+                    break
+                yield FileItem(name=name, path=entry_path, is_directory=True)
+                        
         except Exception as e:
             self.logger.error(f"Error scanning directory {path}: {str(e)}")
             raise
@@ -59,28 +152,12 @@ class FileScanner:
             FileItem: 更新后的文件项
         """
         try:
-            total_size = 0
-            file_count = 0
-            
-            for root, dirs, files in os.walk(item.path):
-                if self.stopped:
-                    break
-                    
-                # 计算文件大小
-                for file in files:
-                    if self.stopped:
-                        break
-                    try:
-                        file_path = os.path.join(root, file)
-                        total_size += os.path.getsize(file_path)
-                        file_count += 1
-                    except Exception as e:
-                        self.logger.error(f"Error getting size of {file_path}: {str(e)}")
+            total_size, file_count = self._walk_directory(item.path)
             
             # 更新文件项信息
             item.size = total_size
             item.file_count = file_count
-            item.status = "已计算" if not self.stopped else "已取消"
+            item.status = "已计算" if not self.stop_event.is_set() else "已取消"
             
             return item
             
@@ -89,6 +166,231 @@ class FileScanner:
             item.status = "计算错误"
             return item
             
+    def _walk_directory(self, root: str) -> Tuple[int, int]:
+        """多线程遍历目录树
+        
+        先在调用线程中遍历, 待处理目录足够多时再交给复用的线程池: 工作线程共享一个
+        LIFO 待处理目录栈, 发现的子目录重新入栈, 使多个 readdir/stat 请求可以同时
+        交给内核处理。小目录树因此不产生任何线程开销。
+        
+        Args:
+            root: 根目录路径
+            
+        Returns:
+            Tuple[int, int]: (总大小, 文件数)
+        """
+        max_workers = max(1, int(self.config.get_setting('scan_threads', DEFAULT_SCAN_THREADS)))
+        pending = [root]
+        totals = [0, 0]
+        
+        # 串行阶段: 目录树很小时在这里就遍历完成
+        parallel_min = WALK_PARALLEL_MIN if max_workers > 1 else float('inf')
+        while pending and len(pending) < parallel_min:
+            if self.stop_event.is_set():
+                return totals[0], totals[1]
+            dir_size, dir_count, subdirs = self._scan_entries(pending.pop())
+            totals[0] += dir_size
+            totals[1] += dir_count
+            pending.extend(subdirs)
+            
+        if not pending or self.stop_event.is_set():
+            return totals[0], totals[1]
+            
+        active = 0
+        cond = threading.Condition()
+        
+        failed = False  # 某个工作线程出错后其余线程也退出
+        
+        def worker():
+            nonlocal active, failed
+            size = count = 0
+            while True:
+                with cond:
+                    # 带超时等待, 停止请求无需其他线程唤醒也能及时生效
+                    while (not pending and active and not failed
+                           and not self.stop_event.is_set()):
+                        cond.wait(WALK_WAIT_TIMEOUT)
+                    if self.stop_event.is_set() or failed or not pending:
+                        cond.notify_all()
+                        break
+                    current = pending.pop()
+                    active += 1
+                    
+                try:
+                    dir_size, dir_count, subdirs = self._scan_entries(current)
+                    size += dir_size
+                    count += dir_count
+                    with cond:
+                        pending.extend(subdirs)
+                except BaseException:
+                    with cond:
+                        failed = True
+                    raise
+                finally:
+                    # 任何情况下都要释放计数并唤醒等待的线程, 否则其余线程会一直等待
+                    with cond:
+                        active -= 1
+                        cond.notify_all()
+                        
+            with cond:
+                totals[0] += size
+                totals[1] += count
+                
+        # 线程数不超过待处理目录数
+        futures = self._submit_walkers(worker, min(max_workers, len(pending)), max_workers)
+        for future in futures:
+            future.result()
+            
+        return totals[0], totals[1]
+        
+    def _submit_walkers(self, worker: Callable[[], None], count: int, max_workers: int) -> list:
+        """向共享的遍历线程池提交 count 个工作线程任务, 线程数配置变化时重建线程池"""
+        with self._walk_executor_lock:
+            if self._walk_executor is None or self._walk_executor_workers != max_workers:
+                if self._walk_executor is not None:
+                    # 已提交到旧线程池的遍历不受影响, 完成后其线程退出
+                    self._walk_executor.shutdown(wait=False)
+                self._walk_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='walk')
+                self._walk_executor_workers = max_workers
+            return [self._walk_executor.submit(worker) for _ in range(count)]
+            
+    def close(self):
+        """释放遍历线程池, 在程序退出前调用"""
+        with self._walk_executor_lock:
+            executor, self._walk_executor = self._walk_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        
+    def _scan_entries(self, path: str) -> Tuple[int, int, List[str]]:
+        """读取单个目录的直接内容
+        
+        启用缓存时结果按目录的 (路径, mtime, inode) 缓存; 目录内条目增删会改变其 mtime,
+        但已有文件的原地修改不会, 此时需清除缓存才能得到最新大小。
+        
+        Args:
+            path: 目录路径
+            
+        Returns:
+            Tuple[int, int, List[str]]: (文件总大小, 文件数, 子目录路径列表)
+        """
+        # 子目录以绝对路径记录, 缓存结果与调用时的路径形式无关
+        path = os.path.abspath(path)
+        
+        # 目录的 mtime 未变化时直接复用上次的结果, 无需重新读取目录
+        key = None
+        if self.size_cache_enabled:
+            try:
+                st = os.stat(path, follow_symlinks=False)
+                key = (path, st.st_mtime_ns, st.st_ino)
+            except OSError:
+                pass
+                
+        if key is not None:
+            with self._size_cache_lock:
+                if self._size_cache is None:
+                    self._size_cache = self._load_size_cache()
+                cached = self._size_cache.get(key)
+                if cached is not None:
+                    self._size_cache.move_to_end(key)
+                    return cached
+                    
+        size = 0
+        count = 0
+        subdirs = []
+        complete = True
+        prefix = os.path.join(path, '')
+        is_stopped = self.stop_event.is_set
+        try:
+            with _scandir_dir(path) as it:
+                for entry in it:
+                    # 超大目录中途也能响应停止 (结果不完整, 不缓存)
+                    if is_stopped():
+                        complete = False
+                        break
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(prefix + entry.name)
+                        else:
+                            size += entry.stat(follow_symlinks=False).st_size
+                            count += 1
+                    except OSError as e:
+                        complete = False
+                        self.logger.error(f"Error getting size of {prefix}{entry.name}: {str(e)}")
+        except OSError as e:
+            complete = False
+            self.logger.error(f"Error scanning directory {path}: {str(e)}")
+            
+        # 只缓存完整读取的目录
+        if key is not None and complete:
+            with self._size_cache_lock:
+                if self._size_cache is None:
+                    self._size_cache = self._load_size_cache()
+                self._size_cache[key] = (size, count, subdirs)
+                self._size_cache_dirty = True
+                while len(self._size_cache) > self._size_cache_max:
+                    self._size_cache.popitem(last=False)
+                    
+        return size, count, subdirs
+        
+    def _load_size_cache(self) -> OrderedDict:
+        """加载目录大小缓存"""
+        cache = OrderedDict()
+        try:
+            if os.path.exists(self._size_cache_file):
+                with open(self._size_cache_file, 'r', encoding='utf-8') as f:
+                    entries = json.load(f)
+                for entry in entries:
+                    if not _is_size_cache_entry(entry):
+                        raise ValueError(f"Invalid size cache entry: {entry!r}")
+                    path, mtime_ns, ino, size, count, subdirs = entry
+                    cache[(path, mtime_ns, ino)] = (size, count, subdirs)
+                while len(cache) > self._size_cache_max:
+                    cache.popitem(last=False)
+        except Exception as e:
+            self.logger.error(f"Error loading size cache: {str(e)}")
+            cache.clear()
+        return cache
+        
+    def save_size_cache(self):
+        """保存目录大小缓存, 在一次计算任务结束后调用"""
+        # 串行执行, 保证较新的快照最后写出
+        with self._size_cache_save_lock:
+            with self._size_cache_lock:
+                if not self._size_cache_dirty or self._size_cache is None:
+                    return
+                entries = [
+                    [path, mtime_ns, ino, size, count, subdirs]
+                    for (path, mtime_ns, ino), (size, count, subdirs) in self._size_cache.items()
+                ]
+                self._size_cache_dirty = False
+                
+            self._write_size_cache(entries)
+            
+    def clear_size_cache(self):
+        """清除内存中的目录大小缓存并删除缓存文件"""
+        with self._size_cache_save_lock:
+            with self._size_cache_lock:
+                self._size_cache = OrderedDict()
+                self._size_cache_dirty = False
+            try:
+                if os.path.exists(self._size_cache_file):
+                    os.remove(self._size_cache_file)
+            except Exception as e:
+                self.logger.error(f"Error clearing size cache: {str(e)}")
+                
+    def _write_size_cache(self, entries: List[list]):
+        """将缓存条目写入文件"""
+        try:
+            cache_dir = os.path.dirname(self._size_cache_file)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            tmp_file = self._size_cache_file + ".tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, ensure_ascii=False)
+            os.replace(tmp_file, self._size_cache_file)
+        except Exception as e:
+            self.logger.error(f"Error saving size cache: {str(e)}")
+            
     def backup_directories(
         self,
         src_paths: List[str],
@@ -106,17 +408,17 @@ class FileScanner:
             bool: 是否成功
         """
         try:
-            self.stopped = False
             total_items = len(src_paths)
+            dest_prefix = os.path.join(dest_path, '')
             
             for index, src_path in enumerate(src_paths, 1):
-                if self.stopped:
+                if self.stop_event.is_set():
                     return False
                     
                 try:
                     # 创建目标目录
                     name = os.path.basename(src_path)
-                    target_path = os.path.join(dest_path, name)
+                    target_path = dest_prefix + name
                     
                     # 复制目录
                     shutil.copytree(
@@ -133,7 +435,7 @@ class FileScanner:
                     self.logger.error(f"Error backing up {src_path}: {str(e)}")
                     return False
                     
-            return not self.stopped
+            return not self.stop_event.is_set()
             
         except Exception as e:
             self.logger.error(f"Error backing up directories: {str(e)}")
@@ -157,29 +459,120 @@ class FileScanner:
             total: 总项目数
         """
         try:
-            # 获取文件大小
-            file_size = os.path.getsize(src)
+            in_fd = os.open(src, os.O_RDONLY | _O_BINARY)
+            try:
+                out_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o666)
+                try:
+                    expected = os.fstat(in_fd).st_size
+                    
+                    # 依次尝试内核态复制, 不支持时回退到普通读写
+                    strategies = self._copy_strategies(in_fd, out_fd)
+                    try:
+                        copied = self._run_copy_strategies(
+                            strategies, src, callback, current, total
+                        )
+                    finally:
+                        for strategy in strategies:
+                            close = getattr(strategy, 'close', None)
+                            if close is not None:
+                                close()
+                finally:
+                    os.close(out_fd)
+            finally:
+                os.close(in_fd)
+                
+            # 复制的字节数必须与源文件大小一致, 否则视为失败
+            if copied != expected:
+                raise OSError(errno.EIO, f"Incomplete copy: {copied} of {expected} bytes")
+                
+            # 复制文件属性
+            shutil.copystat(src, dst)
+            
+        except Exception as e:
+            self.logger.error(f"Error copying {src} to {dst}: {str(e)}")
+            raise
             
-            # 复制文件并报告进度
-            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
-                copied = 0
+    def _run_copy_strategies(
+        self,
+        strategies: List[Callable[[], int]],
+        src: str,
+        callback: Callable,
+        current: int,
+        total: int
+    ) -> int:
+        """按顺序使用复制方式完成复制, 并按间隔报告进度
+        
+        Returns:
+            int: 复制的总字节数
+        """
+        copied = 0
+        last_emit_bytes = 0
+        last_emit_time = time.monotonic()
+        last_index = len(strategies) - 1
+        for index, copy_chunk in enumerate(strategies):
+            try:
                 while True:
-                    if self.stopped:
+                    if self.stop_event.is_set():
                         raise Exception("Operation cancelled")
                         
-                    buf = fsrc.read(8192)
-                    if not buf:
+                    sent = copy_chunk()
+                    if not sent:
                         break
                         
-                    fdst.write(buf)
-                    copied += len(buf)
-                    
+                    copied += sent
                     if callback:
-                        callback(src, current, total, copied)
-                        
-            # 复制文件属性
-            shutil.copystat(src, dst)
+                        # 合并进度回调, 避免跨线程信号淹没界面
+                        now = time.monotonic()
+                        if (copied - last_emit_bytes >= PROGRESS_MIN_BYTES
+                                or now - last_emit_time >= PROGRESS_MIN_INTERVAL):
+                            callback(src, current, total, copied)
+                            last_emit_bytes = copied
+                            last_emit_time = now
+                break
+            except OSError as e:
+                # 只有还有后备方式时才回退, 最后一种方式失败必须报错
+                if e.errno not in _COPY_FALLBACK_ERRNOS or index == last_index:
+                    raise
+                    
+        # 确保文件结束时报告最终进度
+        if callback and copied != last_emit_bytes:
+            callback(src, current, total, copied)
             
-        except Exception as e:
-            self.logger.error(f"Error copying {src} to {dst}: {str(e)}")
-            raise 
\ No newline at end of file
+        return copied
+            
+    def _copy_strategies(self, in_fd: int, out_fd: int) -> List[Callable[[], int]]:
+        """按优先级返回可用的分块复制函数
+        
+        copy_file_range/sendfile 在内核中直接复制页面, 不经过用户态缓冲区;
+        三种方式都基于文件描述符的当前偏移, 可以在中途切换。
+        
+        Args:
+            in_fd: 源文件描述符
+            out_fd: 目标文件描述符
+            
+        Returns:
+            List[Callable[[], int]]: 每次调用复制一块并返回复制的字节数, 0 表示结束
+        """
+        strategies = []
+        if hasattr(os, 'copy_file_range'):
+            strategies.append(lambda: os.copy_file_range(in_fd, out_fd, COPY_CHUNK_SIZE))
+        if _SENDFILE_FILES:
+            strategies.append(lambda: os.sendfile(out_fd, in_fd, None, COPY_CHUNK_SIZE))
+            
+        # 大文件的回退读写由读线程预读, 读取与写入重叠 (如跨磁盘复制);
+        # 返回的对象需要在关闭文件描述符前 close()
+        if (self.config.get_setting('pipelined_copy', True)
+                and os.fstat(in_fd).st_size >= PIPELINE_MIN_SIZE):
+            strategies.append(PipelinedCopy(in_fd, out_fd, COPY_BUFSIZE))
+            return strategies
+            
+        def read_write() -> int:
+            buf = os.read(in_fd, COPY_BUFSIZE)
+            view = memoryview(buf)
+            while view:
+                view = view[os.write(out_fd, view):]
+            return len(buf)
+            
+        strategies.append(read_write)
+        return strategies
+
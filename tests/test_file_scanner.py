@@ -0,0 +1,301 @@
+import errno
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import services.file_scanner as file_scanner
+from models.file_item import FileItem
+from services.file_scanner import FileScanner
+from utils.config_manager import ConfigManager
+
+
+def _walk_totals(root: str):
+    """用 os.walk 计算参考结果"""
+    size = count = 0
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            size += os.lstat(os.path.join(dirpath, name)).st_size
+            count += 1
+    return size, count
+
+
+class ScannerTestCase(unittest.TestCase):
+    """在临时目录中创建扫描器"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        self.config = ConfigManager(os.path.join(self.tmp, 'config.json'))
+        self.config.set_setting('size_cache_file', os.path.join(self.tmp, 'size_cache.json'))
+
+    def make_scanner(self, **settings) -> FileScanner:
+        for key, value in settings.items():
+            self.config.set_setting(key, value)
+        scanner = FileScanner(self.config)
+        self.addCleanup(scanner.close)
+        return scanner
+
+    def make_tree(self, name: str = 'tree', width: int = 6, depth: int = 3) -> str:
+        """创建每层 width 个子目录、每个目录若干文件的目录树"""
+        root = os.path.join(self.tmp, name)
+
+        def build(path, level):
+            os.makedirs(path)
+            for i in range(level + 1):
+                with open(os.path.join(path, f'f{i}'), 'wb') as f:
+                    f.write(b'x' * (i + level + 1))
+            if level < depth:
+                for i in range(width):
+                    build(os.path.join(path, f'd{i}'), level + 1)
+
+        build(root, 0)
+        return root
+
+    def calculate(self, scanner: FileScanner, path: str) -> FileItem:
+        return scanner.calculate_directory_info(FileItem(name=os.path.basename(path), path=path))
+
+
+class WalkDirectoryTest(ScannerTestCase):
+
+    def test_totals_match_os_walk(self):
+        root = self.make_tree()
+        expected = _walk_totals(root)
+        for threads in (1, 4, 16):
+            with self.subTest(scan_threads=threads):
+                item = self.calculate(self.make_scanner(scan_threads=threads), root)
+                self.assertEqual((item.size, item.file_count), expected)
+                self.assertEqual(item.status, "已计算")
+
+    def test_small_tree_does_not_start_walker_pool(self):
+        root = self.make_tree(width=2, depth=1)
+        scanner = self.make_scanner(scan_threads=16)
+        item = self.calculate(scanner, root)
+        self.assertEqual((item.size, item.file_count), _walk_totals(root))
+        self.assertIsNone(scanner._walk_executor)
+
+    def test_walker_pool_is_reused(self):
+        root = self.make_tree()
+        scanner = self.make_scanner(scan_threads=8)
+        self.calculate(scanner, root)
+        executor = scanner._walk_executor
+        self.assertIsNotNone(executor)
+        self.calculate(scanner, root)
+        self.assertIs(scanner._walk_executor, executor)
+
+    def test_error_in_worker_does_not_hang(self):
+        root = self.make_tree()
+        scanner = self.make_scanner(scan_threads=8)
+        scan_entries = scanner._scan_entries
+
+        def failing(path):
+            if os.path.basename(path) == 'd3':
+                raise RuntimeError("boom")
+            return scan_entries(path)
+
+        scanner._scan_entries = failing
+        with self.assertLogs('services.file_scanner', 'ERROR'):
+            item = self.calculate(scanner, root)
+        self.assertEqual(item.status, "计算错误")
+
+    def test_stop_cancels_calculation(self):
+        root = self.make_tree()
+        scanner = self.make_scanner(scan_threads=8)
+        scanner.stop()
+        item = self.calculate(scanner, root)
+        self.assertEqual(item.status, "已取消")
+
+
+class SizeCacheTest(ScannerTestCase):
+
+    def count_scandir_calls(self, scanner: FileScanner, path: str):
+        with mock.patch.object(file_scanner, '_scandir_dir', wraps=file_scanner._scandir_dir) as scandir:
+            item = self.calculate(scanner, path)
+        return item, scandir.call_count
+
+    def test_disabled_by_default(self):
+        root = self.make_tree(width=2, depth=1)
+        scanner = self.make_scanner()
+        self.calculate(scanner, root)
+        scanner.save_size_cache()
+        self.assertIsNone(scanner._size_cache)
+        self.assertFalse(os.path.exists(self.config.get_setting('size_cache_file')))
+
+    def test_hit_skips_directory_reads(self):
+        root = self.make_tree(width=2, depth=2)
+        scanner = self.make_scanner(size_cache_enabled=True)
+        first, reads = self.count_scandir_calls(scanner, root)
+        self.assertGreater(reads, 0)
+        second, reads = self.count_scandir_calls(scanner, root)
+        self.assertEqual(reads, 0)
+        self.assertEqual((second.size, second.file_count), (first.size, first.file_count))
+
+    def test_new_entry_invalidates_directory(self):
+        root = self.make_tree(width=2, depth=2)
+        scanner = self.make_scanner(size_cache_enabled=True)
+        self.calculate(scanner, root)
+
+        subdir = os.path.join(root, 'd1', 'd0')
+        st = os.stat(subdir)
+        with open(os.path.join(subdir, 'new'), 'wb') as f:
+            f.write(b'y' * 100)
+        # 保证 mtime 变化, 不受文件系统时间精度影响
+        os.utime(subdir, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+
+        item, reads = self.count_scandir_calls(scanner, root)
+        self.assertEqual(reads, 1)
+        self.assertEqual((item.size, item.file_count), _walk_totals(root))
+
+    def test_clear_forgets_stale_sizes(self):
+        root = self.make_tree(width=2, depth=1)
+        scanner = self.make_scanner(size_cache_enabled=True)
+        self.calculate(scanner, root)
+        scanner.save_size_cache()
+
+        # 原地修改不改变目录 mtime, 缓存给出旧结果, 清除后重新读取
+        with open(os.path.join(root, 'f0'), 'ab') as f:
+            f.write(b'z' * 50)
+        self.assertNotEqual(self.calculate(scanner, root).size, _walk_totals(root)[0])
+        scanner.clear_size_cache()
+        self.assertFalse(os.path.exists(self.config.get_setting('size_cache_file')))
+        self.assertEqual(self.calculate(scanner, root).size, _walk_totals(root)[0])
+
+    def test_saved_cache_uses_absolute_paths_and_reloads(self):
+        root = self.make_tree(width=2, depth=1)
+        cwd = os.getcwd()
+        os.chdir(self.tmp)
+        self.addCleanup(os.chdir, cwd)
+
+        scanner = self.make_scanner(size_cache_enabled=True)
+        self.calculate(scanner, os.path.basename(root))
+        scanner.save_size_cache()
+        with open(self.config.get_setting('size_cache_file'), encoding='utf-8') as f:
+            entries = json.load(f)
+        self.assertTrue(entries)
+        for path, _, _, _, _, subdirs in entries:
+            self.assertTrue(os.path.isabs(path))
+            self.assertTrue(all(os.path.isabs(subdir) for subdir in subdirs))
+
+        reloaded = self.make_scanner()
+        item, reads = self.count_scandir_calls(reloaded, root)
+        self.assertEqual(reads, 0)
+        self.assertEqual((item.size, item.file_count), _walk_totals(root))
+
+    def test_invalid_cache_file_is_ignored(self):
+        root = self.make_tree(width=2, depth=1)
+        with open(self.config.get_setting('size_cache_file'), 'w', encoding='utf-8') as f:
+            json.dump([[root, 1, 2, 3, 4, None]], f)
+        scanner = self.make_scanner(size_cache_enabled=True)
+        with self.assertLogs('services.file_scanner', 'ERROR'):
+            item = self.calculate(scanner, root)
+        self.assertEqual((item.size, item.file_count), _walk_totals(root))
+
+
+class CopyStrategyTest(ScannerTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.src = os.path.join(self.tmp, 'src.bin')
+        self.dst = os.path.join(self.tmp, 'dst.bin')
+
+    def write_source(self, size: int) -> bytes:
+        data = os.urandom(size)
+        with open(self.src, 'wb') as f:
+            f.write(data)
+        return data
+
+    def copy(self, scanner: FileScanner) -> bytes:
+        scanner._copy_with_progress(self.src, self.dst, lambda *args: None, 1, 1)
+        with open(self.dst, 'rb') as f:
+            return f.read()
+
+    def unsupported(self, *args):
+        raise OSError(errno.EXDEV, "unsupported")
+
+    def patch_kernel_copy(self, copy_file_range=True, sendfile=True):
+        """让内核态复制方式失败, 强制回退"""
+        patches = []
+        if copy_file_range and hasattr(os, 'copy_file_range'):
+            patches.append(mock.patch.object(os, 'copy_file_range', self.unsupported))
+        if sendfile and hasattr(os, 'sendfile'):
+            patches.append(mock.patch.object(os, 'sendfile', self.unsupported))
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_default_strategy(self):
+        data = self.write_source(3 * 1024 * 1024 + 17)
+        self.assertEqual(self.copy(self.make_scanner()), data)
+
+    def test_fallback_to_sendfile(self):
+        data = self.write_source(3 * 1024 * 1024 + 17)
+        self.patch_kernel_copy(sendfile=False)
+        self.assertEqual(self.copy(self.make_scanner()), data)
+
+    def test_fallback_to_read_write(self):
+        data = self.write_source(file_scanner.PIPELINE_MIN_SIZE - 1)
+        self.patch_kernel_copy()
+        self.assertEqual(self.copy(self.make_scanner()), data)
+
+    def test_fallback_to_read_write_for_large_file(self):
+        data = self.write_source(file_scanner.PIPELINE_MIN_SIZE + 123)
+        self.patch_kernel_copy()
+        self.assertEqual(self.copy(self.make_scanner(pipelined_copy=False)), data)
+
+    def test_fallback_to_pipelined_copy(self):
+        data = self.write_source(file_scanner.PIPELINE_MIN_SIZE * 2 + 123)
+        self.patch_kernel_copy()
+        with mock.patch.object(file_scanner, 'PipelinedCopy', wraps=file_scanner.PipelinedCopy) as pipelined:
+            self.assertEqual(self.copy(self.make_scanner(pipelined_copy=True)), data)
+        pipelined.assert_called_once()
+
+    @unittest.skipUnless(hasattr(os, 'copy_file_range'), "copy_file_range not available")
+    def test_fallback_after_partial_kernel_copy(self):
+        data = self.write_source(file_scanner.COPY_CHUNK_SIZE * 2 + 321)
+        copy_file_range = os.copy_file_range
+        calls = []
+
+        def first_chunk_only(*args):
+            calls.append(args)
+            if len(calls) > 1:
+                raise OSError(errno.EXDEV, "unsupported")
+            return copy_file_range(*args)
+
+        with mock.patch.object(os, 'copy_file_range', first_chunk_only):
+            self.assertEqual(self.copy(self.make_scanner()), data)
+
+    def test_last_strategy_error_fails_copy(self):
+        self.write_source(1024)
+        self.patch_kernel_copy()
+
+        def failing_write(fd, data):
+            raise OSError(errno.EINVAL, "invalid")
+
+        scanner = self.make_scanner()
+        with mock.patch.object(os, 'write', failing_write), self.assertLogs('services.file_scanner', 'ERROR'):
+            with self.assertRaises(OSError):
+                self.copy(scanner)
+
+    def test_short_copy_fails(self):
+        self.write_source(1024)
+        scanner = self.make_scanner()
+        with mock.patch.object(scanner, '_run_copy_strategies', return_value=512), \
+                self.assertLogs('services.file_scanner', 'ERROR'):
+            with self.assertRaises(OSError):
+                self.copy(scanner)
+
+    def test_sendfile_skipped_off_linux(self):
+        self.write_source(0)
+        fd = os.open(self.src, os.O_RDONLY)
+        self.addCleanup(os.close, fd)
+        with mock.patch.object(file_scanner, '_SENDFILE_FILES', False):
+            strategies = self.make_scanner()._copy_strategies(fd, fd)
+        # 只剩 copy_file_range (若可用) 和普通读写
+        self.assertEqual(len(strategies), int(hasattr(os, 'copy_file_range')) + 1)
+        self.assertEqual(strategies[-1].__name__, 'read_write')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+
+try:
+    from PyQt5.QtCore import Qt
+except ImportError:  # 界面依赖未安装时跳过
+    Qt = None
+
+from models.file_item import FileItem
+
+
+@unittest.skipIf(Qt is None, "PyQt5 not installed")
+class FileTableModelCountersTest(unittest.TestCase):
+
+    def setUp(self):
+        from viewmodels.main_viewmodel import FileTableModel
+        self.model = FileTableModel()
+
+    def make_items(self, count: int, **kwargs):
+        return [FileItem(name=f'd{i}', path=f'/tmp/d{i}', **kwargs) for i in range(count)]
+
+    def assert_counters_match(self):
+        items = [self.model.get_item(row) for row in range(self.model.rowCount())]
+        self.assertEqual(self.model.checked_count(), sum(item.checked for item in items))
+        self.assertEqual(self.model.total_size_bytes(), sum(item.size or 0 for item in items))
+        self.assertEqual(self.model.total_files(), sum(item.file_count or 0 for item in items))
+
+    def test_add_items_counts_existing_values(self):
+        items = self.make_items(3, size=10, file_count=2)
+        items[1].checked = True
+        self.model.add_items(items)
+        self.model.add_item(FileItem(name='x', path='/tmp/x', size=5, file_count=1))
+        self.assertEqual(self.model.get_total_size()[0], 35)
+        self.assert_counters_match()
+
+    def test_update_replaces_previous_contribution(self):
+        items = self.make_items(3)
+        self.model.add_items(items)
+        for size in (100, 40, 70):
+            items[0].size = size
+            items[0].file_count = size // 10
+            self.model.update_item(items[0])
+        items[1].size = 5
+        items[2].size = 6
+        self.model.update_items(items[1:])
+        self.assertEqual(self.model.total_size_bytes(), 81)
+        self.assert_counters_match()
+
+    def test_unknown_item_is_ignored(self):
+        self.model.add_items(self.make_items(2, size=1))
+        self.model.update_item(FileItem(name='other', path='/tmp/other', size=1000))
+        self.assert_counters_match()
+
+    def test_checked_count(self):
+        self.model.add_items(self.make_items(4))
+        index = self.model.index(2, 0)
+        self.model.setData(index, Qt.Checked, Qt.CheckStateRole)
+        self.model.setData(index, Qt.Checked, Qt.CheckStateRole)
+        self.assertEqual(self.model.checked_count(), 1)
+        self.model.set_all_checked(True)
+        self.assertEqual(self.model.checked_count(), 4)
+        self.model.setData(index, Qt.Unchecked, Qt.CheckStateRole)
+        self.assert_counters_match()
+
+    def test_clear_resets_counters(self):
+        self.model.add_items(self.make_items(3, size=10, file_count=1, checked=True))
+        self.model.clear()
+        self.assertEqual(
+            (self.model.checked_count(), self.model.total_size_bytes(), self.model.total_files()),
+            (0, 0, 0)
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
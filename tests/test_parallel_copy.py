@@ -0,0 +1,82 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from services.parallel_copy import PipelinedCopy
+
+
+class PipelinedCopyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        self.src = os.path.join(self.tmp, 'src.bin')
+        self.dst = os.path.join(self.tmp, 'dst.bin')
+        self.data = os.urandom(256 * 1024 + 7)
+        with open(self.src, 'wb') as f:
+            f.write(self.data)
+        self.in_fd = os.open(self.src, os.O_RDONLY)
+        self.addCleanup(os.close, self.in_fd)
+        self.out_fd = os.open(self.dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        self.addCleanup(os.close, self.out_fd)
+
+    def read_dst(self) -> bytes:
+        with open(self.dst, 'rb') as f:
+            return f.read()
+
+    def test_copies_whole_file(self):
+        copy = PipelinedCopy(self.in_fd, self.out_fd, 8192)
+        copied = 0
+        try:
+            while True:
+                sent = copy()
+                if not sent:
+                    break
+                copied += sent
+        finally:
+            copy.close()
+        self.assertEqual(copied, len(self.data))
+        self.assertEqual(self.read_dst(), self.data)
+
+    def test_continues_from_current_offset(self):
+        os.write(self.out_fd, os.read(self.in_fd, 1000))
+        copy = PipelinedCopy(self.in_fd, self.out_fd, 4096)
+        try:
+            while copy():
+                pass
+        finally:
+            copy.close()
+        self.assertEqual(self.read_dst(), self.data)
+
+    def test_close_mid_copy_stops_reader(self):
+        before = threading.active_count()
+        copy = PipelinedCopy(self.in_fd, self.out_fd, 1024, depth=2)
+        self.assertEqual(copy(), 1024)
+        # 等待读线程填满队列并阻塞在 put 上
+        time.sleep(0.2)
+        reader = copy._reader
+        started = time.monotonic()
+        copy.close()
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertFalse(reader.is_alive())
+        self.assertEqual(threading.active_count(), before)
+
+    def test_close_before_start(self):
+        copy = PipelinedCopy(self.in_fd, self.out_fd, 1024)
+        copy.close()
+        self.assertIsNone(copy._reader)
+
+    def test_read_error_is_raised_in_writer(self):
+        copy = PipelinedCopy(self.out_fd, self.out_fd, 1024)  # 只写描述符, 读取失败
+        try:
+            with self.assertRaises(OSError):
+                copy()
+        finally:
+            copy.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
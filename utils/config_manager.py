@@ -10,6 +10,8 @@ class ConfigManager:
         self.config_file = config_file
         self.logger = logging.getLogger(__name__)
         self._config = self._load_config()
+        self._dirty = False  # 是否有未保存的修改
+        self._save_pending = False  # 是否已安排延迟保存
         
     def _load_config(self) -> dict:
         """加载配置"""
@@ -23,13 +25,36 @@ class ConfigManager:
             return {}
             
     def save_config(self):
-        """保存配置"""
+        """保存配置
+        
+        先写入临时文件再原子替换, 避免写入中断导致配置文件损坏。
+        """
+        if not self._dirty:
+            return
+            
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
+            tmp_file = self.config_file + ".tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
                 json.dump(self._config, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_file, self.config_file)
+            self._dirty = False
         except Exception as e:
             self.logger.error(f"Error saving config: {str(e)}")
             
+    def schedule_save(self, delay_ms: int = 500):
+        """延迟保存配置, 合并短时间内的多次修改"""
+        if self._save_pending:
+            return
+            
+        from PyQt5.QtCore import QTimer
+        self._save_pending = True
+        QTimer.singleShot(delay_ms, self._flush_scheduled_save)
+        
+    def _flush_scheduled_save(self):
+        """执行已安排的延迟保存"""
+        self._save_pending = False
+        self.save_config()
+            
     def get_setting(self, key: str, default: Any = None) -> Any:
         """获取配置项"""
         return self._config.get(key, default)
@@ -37,6 +62,7 @@ class ConfigManager:
     def set_setting(self, key: str, value: Any):
         """设置配置项"""
         self._config[key] = value
+        self._dirty = True
         
     def add_recent_directory(self, path: str):
         """添加最近使用的目录"""
@@ -55,7 +81,7 @@ class ConfigManager:
             
             self.set_setting('recent_directories', recent_dirs)
             self.set_setting('last_directory', path)
-            self.save_config()
+            self.schedule_save()
             
         except Exception as e:
             self.logger.error(f"Error adding recent directory: {str(e)}") 
\ No newline at end of file
@@ -1,15 +1,21 @@
 import logging
-from datetime import datetime
+from collections import deque
+from datetime import datetime, timedelta
+from time import monotonic
+
+# 60 秒内超过 10 个错误视为错误过多
+ERROR_BURST_LIMIT = 10
+ERROR_BURST_WINDOW = 60
 
 class ErrorHandler:
     def __init__(self, logger):
         self.logger = logger
         self.error_count = 0
-        self.last_error_time = None
+        self._recent = deque(maxlen=ERROR_BURST_LIMIT + 1)  # 最近错误的 monotonic 时间戳
         
     def handle_error(self, error_type: str, error: Exception, context: str = None):
         """统一错误处理"""
-        current_time = datetime.now()
+        self._recent.append(monotonic())
         self.error_count += 1
         
         # 记录错误
@@ -20,20 +26,25 @@ class ErrorHandler:
         self.logger.error(error_msg)
         
         # 检查错误频率
-        if self.last_error_time:
-            time_diff = (current_time - self.last_error_time).total_seconds()
-            if time_diff < 60 and self.error_count > 10:
-                self.logger.critical("Too many errors occurring! Consider stopping operations.")
-                return False
-                
-        self.last_error_time = current_time
+        recent = self._recent
+        if len(recent) == recent.maxlen and recent[-1] - recent[0] < ERROR_BURST_WINDOW:
+            self.logger.critical("Too many errors occurring! Consider stopping operations.")
+            return False
+            
         return True
-
+        
     def reset_error_count(self):
         """重置错误计数"""
         self.error_count = 0
-        self.last_error_time = None
+        self._recent.clear()
+        
+    @property
+    def last_error_time(self) -> datetime:
+        """最近一次错误的时间"""
+        if not self._recent:
+            return None
+        return datetime.now() - timedelta(seconds=monotonic() - self._recent[-1])
         
     def get_error_status(self) -> tuple[int, datetime]:
         """获取当前错误状态"""
-        return self.error_count, self.last_error_time 
\ No newline at end of file
+        return self.error_count, self.last_error_time
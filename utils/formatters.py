@@ -0,0 +1,22 @@
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+SPEED_UNITS = ('B/s', 'KB/s', 'MB/s', 'GB/s')
+
+
+def _unit_index(value: float, max_index: int) -> int:
+    """根据数值的二进制位数计算 1024 进制单位下标"""
+    n = int(value)
+    if n <= 0:
+        return 0
+    return min((n.bit_length() - 1) // 10, max_index)
+
+
+def format_size(size: int) -> str:
+    """格式化字节大小, 如 "1.50 MB" """
+    unit_index = _unit_index(size, len(SIZE_UNITS) - 1)
+    return f"{size / (1 << (unit_index * 10)):.2f} {SIZE_UNITS[unit_index]}"
+
+
+def format_speed(bytes_per_second: float) -> str:
+    """格式化传输速度, 如 "12.3 MB/s" """
+    unit_index = _unit_index(bytes_per_second, len(SPEED_UNITS) - 1)
+    return f"{bytes_per_second / (1 << (unit_index * 10)):.1f} {SPEED_UNITS[unit_index]}"
@@ -1,10 +1,20 @@
 import os
+import queue
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from datetime import datetime
+from typing import Optional
 
 class LogManager:
-    """日志管理器"""
+    """日志管理器
+    
+    根日志记录器只挂载一个 QueueHandler, 文件和控制台输出由后台
+    QueueListener 线程完成, 调用方线程不会阻塞在磁盘写入上。
+    """
+    
+    # 进程内共享, 多次实例化不会重复添加处理器
+    _queue_handler: Optional[QueueHandler] = None
+    _listener: Optional[QueueListener] = None
     
     def __init__(self, log_dir: str = "logs"):
         self.log_dir = log_dir
@@ -13,9 +23,11 @@ class LogManager:
     def _setup_logging(self):
         """设置日志"""
         try:
+            if LogManager._listener is not None:
+                return
+                
             # 创建日志目录
-            if not os.path.exists(self.log_dir):
-                os.makedirs(self.log_dir)
+            os.makedirs(self.log_dir, exist_ok=True)
             
             # 设置日志文件路径
             log_file = os.path.join(
@@ -48,14 +60,37 @@ class LogManager:
             file_handler.setFormatter(formatter)
             console_handler.setFormatter(formatter)
             
-            # 添加处理器
-            logger.addHandler(file_handler)
-            logger.addHandler(console_handler)
+            # 通过队列交给后台线程写入
+            log_queue = queue.Queue(-1)
+            queue_handler = QueueHandler(log_queue)
+            logger.addHandler(queue_handler)
+            
+            listener = QueueListener(
+                log_queue,
+                file_handler,
+                console_handler,
+                respect_handler_level=True
+            )
+            listener.start()
+            
+            LogManager._queue_handler = queue_handler
+            LogManager._listener = listener
             
         except Exception as e:
             print(f"Error setting up logging: {str(e)}")
             raise
             
+    def stop(self):
+        """停止后台日志线程, 写出队列中剩余的日志"""
+        listener = LogManager._listener
+        if listener is None:
+            return
+            
+        logging.getLogger().removeHandler(LogManager._queue_handler)
+        listener.stop()
+        LogManager._queue_handler = None
+        LogManager._listener = None
+            
     def log_operation(self, operation: str, details: str, result: str, level: str = "info"):
         """记录操作日志
         
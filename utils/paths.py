@@ -0,0 +1,13 @@
+import os
+import functools
+
+# 用户主目录, 进程运行期间不变
+HOME_DIR = os.path.expanduser('~')
+
+
+@functools.lru_cache(maxsize=None)
+def get_documents_dir() -> str:
+    """获取用户文档目录, 不可用时回退到主目录"""
+    from PyQt5.QtCore import QStandardPaths
+    path = QStandardPaths.writableLocation(QStandardPaths.DocumentsLocation)
+    return path or HOME_DIR
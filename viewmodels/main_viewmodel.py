@@ -7,12 +7,44 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from PyQt5.QtCore import Qt, QAbstractTableModel
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
 from PyQt5.QtGui import QColor
-import pandas as pd
 import logging
 from typing import List, Any
 from models.file_item import FileItem
+from utils.formatters import format_size
+
+# 绘制用常量, 只创建一次
+_BG_ERROR = QColor("#fee2e2")  # 浅红色
+_BG_OK = QColor("#dcfce7")  # 浅绿色
+_ALIGN_LEFT = Qt.AlignLeft | Qt.AlignVCenter
+_ALIGN_RIGHT = Qt.AlignRight | Qt.AlignVCenter
+
+# 状态背景色
+_STATUS_COLORS = {
+    "计算错误": _BG_ERROR,
+    "已计算": _BG_OK,
+}
+
+def _build_dispatch(column_count: int) -> dict:
+    """构建 (role, column) -> 取值函数 的分派表"""
+    # 未登记的组合返回 None, 例如复选框列不显示文本
+    dispatch = {
+        (Qt.DisplayRole, 1): lambda item: item.name,
+        (Qt.DisplayRole, 2): lambda item: item.format_size(),
+        (Qt.DisplayRole, 3): lambda item: str(item.file_count) if item.file_count is not None else "未计算",
+        (Qt.DisplayRole, 4): lambda item: item.status,
+        (Qt.CheckStateRole, 0): lambda item: Qt.Checked if item.checked else Qt.Unchecked,
+    }
+    
+    for col in range(column_count):
+        if col in (2, 3):  # 大小和文件数列右对齐
+            dispatch[(Qt.TextAlignmentRole, col)] = lambda item: _ALIGN_RIGHT
+        else:
+            dispatch[(Qt.TextAlignmentRole, col)] = lambda item: _ALIGN_LEFT
+        dispatch[(Qt.BackgroundRole, col)] = lambda item: _STATUS_COLORS.get(item.status)
+        
+    return dispatch
 
 class FileTableModel(QAbstractTableModel):
     """文件表格数据模型"""
@@ -20,10 +52,22 @@ class FileTableModel(QAbstractTableModel):
     # 列定义
     COLUMNS = ['选择', '名称', '大小', '文件数', '状态']
     
+    # data() 分派表
+    DISPATCH = _build_dispatch(len(COLUMNS))
+    
+    # 导出列定义
+    EXPORT_COLUMNS = ['名称', '路径', '大小', '文件数', '状态']
+    
     def __init__(self):
         super().__init__()
         self._data: List[FileItem] = []
-        self._cache = {}  # 缓存计算结果
+        self._rows = {}  # id(item) -> 行号
+        
+        # 增量维护的统计值, 避免每次刷新界面都遍历所有行
+        self._counted = {}  # id(item) -> 已计入统计的 (大小, 文件数)
+        self._checked_count = 0
+        self._total_size = 0
+        self._total_files = 0
         self.logger = logging.getLogger(__name__)
 
     def rowCount(self, parent=None) -> int:
@@ -36,36 +80,8 @@ class FileTableModel(QAbstractTableModel):
         if not index.isValid():
             return None
             
-        item = self._data[index.row()]
-        col = index.column()
-        
-        if role == Qt.DisplayRole:
-            if col == 0:
-                return None  # 复选框列不显示文本
-            elif col == 1:
-                return item.name
-            elif col == 2:
-                return item.format_size()
-            elif col == 3:
-                return str(item.file_count) if item.file_count is not None else "未计算"
-            elif col == 4:
-                return item.status
-                
-        elif role == Qt.CheckStateRole and col == 0:
-            return Qt.Checked if item.checked else Qt.Unchecked
-            
-        elif role == Qt.TextAlignmentRole:
-            if col in [2, 3]:  # 大小和文件数列右对齐
-                return Qt.AlignRight | Qt.AlignVCenter
-            return Qt.AlignLeft | Qt.AlignVCenter
-            
-        elif role == Qt.BackgroundRole:
-            if item.status == "计算错误":
-                return QColor("#fee2e2")  # 浅红色
-            elif item.status == "已计算":
-                return QColor("#dcfce7")  # 浅绿色
-                
-        return None
+        fn = self.DISPATCH.get((role, index.column()))
+        return fn(self._data[index.row()]) if fn else None
 
     def headerData(self, section, orientation, role=Qt.DisplayRole):
         if orientation == Qt.Horizontal and role == Qt.DisplayRole:
@@ -87,25 +103,99 @@ class FileTableModel(QAbstractTableModel):
             return False
             
         if role == Qt.CheckStateRole and index.column() == 0:
-            self._data[index.row()].checked = bool(value == Qt.Checked)
+            item = self._data[index.row()]
+            checked = bool(value == Qt.Checked)
+            if checked != item.checked:
+                self._checked_count += 1 if checked else -1
+            item.checked = checked
             self.dataChanged.emit(index, index, [role])
             return True
             
         return False
 
+    def set_all_checked(self, checked: bool):
+        """设置所有项目的选中状态, 只发出一次 dataChanged"""
+        for item in self._data:
+            item.checked = checked
+        self._checked_count = len(self._data) if checked else 0
+            
+        if self._data:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self._data) - 1, 0),
+                [Qt.CheckStateRole]
+            )
+
     def clear(self):
         """清空数据"""
         self.beginResetModel()
         self._data.clear()
-        self._cache.clear()
+        self._rows.clear()
+        self._counted.clear()
+        self._checked_count = 0
+        self._total_size = 0
+        self._total_files = 0
         self.endResetModel()
 
     def add_item(self, item: FileItem):
         """添加项目"""
         self.beginInsertRows(self.index(0, 0), len(self._data), len(self._data))
+        self._rows[id(item)] = len(self._data)
         self._data.append(item)
+        self._count_item(item)
         self.endInsertRows()
 
+    def add_items(self, items: List[FileItem]):
+        """批量添加项目, 只触发一次行插入通知"""
+        if not items:
+            return
+            
+        first = len(self._data)
+        self.beginInsertRows(QModelIndex(), first, first + len(items) - 1)
+        for row, item in enumerate(items, first):
+            self._rows[id(item)] = row
+            self._count_item(item)
+        self._data.extend(items)
+        self.endInsertRows()
+
+    def _count_item(self, item: FileItem):
+        """将新加入的项目计入统计"""
+        if item.checked:
+            self._checked_count += 1
+        self._recount_item(item)
+
+    def _recount_item(self, item: FileItem):
+        """用项目的当前大小和文件数替换其原有的统计贡献"""
+        size = item.size or 0
+        files = item.file_count or 0
+        old_size, old_files = self._counted.get(id(item), (0, 0))
+        self._total_size += size - old_size
+        self._total_files += files - old_files
+        self._counted[id(item)] = (size, files)
+
+    def update_item(self, item: FileItem):
+        """通知项目数据已更新"""
+        row = self._rows.get(id(item))
+        if row is None:
+            return
+        self._recount_item(item)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.COLUMNS) - 1))
+
+    def update_items(self, items: List[FileItem]):
+        """通知多个项目数据已更新, 合并为一次 dataChanged"""
+        rows = []
+        for item in items:
+            row = self._rows.get(id(item))
+            if row is not None:
+                rows.append(row)
+                self._recount_item(item)
+        if not rows:
+            return
+        self.dataChanged.emit(
+            self.index(min(rows), 0),
+            self.index(max(rows), len(self.COLUMNS) - 1)
+        )
+
     def get_item(self, row: int) -> FileItem:
         """获取指定行的项目"""
         return self._data[row]
@@ -114,50 +204,78 @@ class FileTableModel(QAbstractTableModel):
         """获取选中的项目"""
         return [item for item in self._data if item.checked]
 
+    def checked_count(self) -> int:
+        """选中的项目数"""
+        return self._checked_count
+
+    def total_size_bytes(self) -> int:
+        """总大小 (字节)"""
+        return self._total_size
+
+    def total_files(self) -> int:
+        """总文件数"""
+        return self._total_files
+
     def get_total_size(self) -> tuple[int, str]:
         """获取总大小"""
-        total_size = sum(item.size or 0 for item in self._data if item.size is not None)
-        
-        # 格式化大小
-        units = ['B', 'KB', 'MB', 'GB', 'TB']
-        size = float(total_size)
-        unit_index = 0
-        
-        while size >= 1024 and unit_index < len(units) - 1:
-            size /= 1024
-            unit_index += 1
-            
-        return total_size, f"{size:.2f} {units[unit_index]}"
+        return self._total_size, format_size(self._total_size)
 
     def get_total_files(self) -> int:
         """获取总文件数"""
-        return sum(item.file_count or 0 for item in self._data if item.file_count is not None)
+        return self._total_files
 
     def export_to_excel(self, filepath: str, items: List[FileItem] = None):
         """导出到Excel"""
         try:
             # 使用指定项目或所有项目
-            items = items or self._data
-            
-            # 准备数据
-            data = []
-            for item in items:
-                data.append({
-                    '名称': item.name,
-                    '路径': item.path,
-                    '大小': item.format_size(),
-                    '文件数': item.file_count or 0,
-                    '状态': item.status
-                })
-            
-            # 创建DataFrame并导出
-            df = pd.DataFrame(data)
-            df.to_excel(filepath, index=False, engine='openpyxl')
+            self.write_excel(filepath, self.get_export_rows(items))
             
         except Exception as e:
             self.logger.error(f"Error exporting to Excel: {str(e)}")
             raise 
 
+    def get_export_rows(self, items: List[FileItem] = None) -> List[tuple]:
+        """生成导出数据快照, 可安全地交给其他线程写出
+        
+        Args:
+            items: 要导出的项目, 默认为全部项目
+        """
+        return [
+            (item.name, item.path, item.format_size(), item.file_count or 0, item.status)
+            for item in (items or self._data)
+        ]
+
+    @classmethod
+    def write_excel(cls, filepath: str, rows: List[tuple]):
+        """将导出数据写入Excel
+        
+        优先使用 xlsxwriter 的 constant_memory 模式逐行写出, 内存占用与行数无关;
+        未安装 xlsxwriter 时回退到 pandas + openpyxl。
+        """
+        try:
+            import xlsxwriter
+        except ImportError:
+            cls._write_excel_pandas(filepath, rows)
+            return
+            
+        workbook = xlsxwriter.Workbook(filepath, {'constant_memory': True})
+        try:
+            worksheet = workbook.add_worksheet()
+            worksheet.write_row(0, 0, cls.EXPORT_COLUMNS)
+            for row, values in enumerate(rows, 1):
+                worksheet.write_row(row, 0, values)
+        finally:
+            workbook.close()
+
+    @classmethod
+    def _write_excel_pandas(cls, filepath: str, rows: List[tuple]):
+        """使用 pandas 导出到Excel"""
+        # pandas 导入较慢且占用内存, 只在需要时加载
+        import pandas as pd
+        
+        df = pd.DataFrame.from_records(rows, columns=cls.EXPORT_COLUMNS)
+        df.to_excel(filepath, index=False, engine='openpyxl')
+
     def update_system_resources(self, cpu_usage, memory_usage):
         # 假设 self.main_window 是对 views.main_window 的引用
         if self.main_window.cpu_label:  # 检查 cpu_label 是否存在
@@ -168,4 +286,4 @@ class FileTableModel(QAbstractTableModel):
         if self.main_window.memory_label:  # 检查 memory_label 是否存在
             self.main_window.memory_label.setText(f"内存使用率: {memory_usage}%")
         else:
-            self.logger.error("内存标签未初始化") 
\ No newline at end of file
+            self.logger.error("内存标签未初始化")
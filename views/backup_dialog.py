@@ -5,6 +5,8 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt, pyqtSignal
 import os
 import logging
+from utils.formatters import format_speed
+from utils.paths import HOME_DIR
 
 class BackupDialog(QDialog):
     """备份对话框"""
@@ -14,6 +16,7 @@ class BackupDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.logger = logging.getLogger(__name__)
+        self._last_progress = None  # 上次显示的 (进度, 文件)
         self._setup_ui()
         
     def _setup_ui(self):
@@ -74,7 +77,7 @@ class BackupDialog(QDialog):
             path = QFileDialog.getExistingDirectory(
                 self,
                 "选择备份目标文件夹",
-                os.path.expanduser("~"),
+                HOME_DIR,
                 QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks
             )
             
@@ -119,16 +122,22 @@ class BackupDialog(QDialog):
             self.logger.error(f"Error starting backup: {str(e)}")
             QMessageBox.critical(self, "错误", f"开始备份时出错：{str(e)}")
             
-    def update_progress(self, current_file: str, current: int, total: int, speed: float, total_bytes: int):
+    def update_progress(self, file_name: str, current: int, total: int, speed: float, total_bytes: int):
         """更新进度显示"""
         try:
             # 更新进度条
-            progress = int(current * 100 / total)
+            progress = current * 100 // total if total else 0
+            
+            # 进度未变化时跳过重绘
+            if (progress, file_name) == self._last_progress:
+                return
+            self._last_progress = (progress, file_name)
+            
             self.progress_bar.setValue(progress)
             
             # 更新状态标签
             status = (
-                f"正在备份: {os.path.basename(current_file)}\n"
+                f"正在备份: {file_name}\n"
                 f"进度: {current}/{total} ({progress}%)\n"
                 f"速度: {self._format_speed(speed)}"
             )
@@ -155,17 +164,4 @@ class BackupDialog(QDialog):
             
     def _format_speed(self, bytes_per_second: float) -> str:
         """格式化速度显示"""
-        try:
-            units = ['B/s', 'KB/s', 'MB/s', 'GB/s']
-            speed = bytes_per_second
-            unit_index = 0
-            
-            while speed >= 1024 and unit_index < len(units) - 1:
-                speed /= 1024
-                unit_index += 1
-                
-            return f"{speed:.1f} {units[unit_index]}"
-            
-        except Exception as e:
-            self.logger.error(f"Error formatting speed: {str(e)}")
-            return "0 B/s" 
\ No newline at end of file
+        return format_speed(bytes_per_second)
\ No newline at end of file
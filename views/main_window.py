@@ -5,32 +5,38 @@ import json
 import logging
 import traceback
 import time
-from datetime import datetime
-from typing import Optional, Dict, Any, List, Tuple, Callable
+import functools
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple, Callable
 from pathlib import Path
-import psutil
 
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QPushButton, QTableView, 
     QFileDialog, QProgressBar, QStatusBar, QHBoxLayout, QMessageBox, 
-    QLabel, QMenu, QLineEdit, QListWidget, QDialog, QShortcut, 
+    QLabel, QMenu, QLineEdit, QListWidget, QDialog, QAction, 
     QCheckBox, QApplication, QFrame, QStyle, QSizePolicy, QHeaderView
 )
 from PyQt5.QtCore import (
     QThread, pyqtSignal, Qt, QDir, QTimer, QUrl, QItemSelectionModel, 
-    QSize, QPoint
+    QSize, QPoint, QElapsedTimer, QRunnable, QThreadPool
 )
 from PyQt5.QtGui import QIcon, QKeySequence, QColor, QCursor
 
 from services.file_scanner import FileScanner
 from utils.config_manager import ConfigManager
 from utils.logger import LogManager
+from utils.formatters import format_speed
+from utils.paths import HOME_DIR, get_documents_dir
 from models.file_item import FileItem
 from viewmodels.main_viewmodel import FileTableModel
-from workers.backup_worker import BackupWorker
-from workers.calculate_worker import CalculateWorker
-from workers.scan_worker import ScanWorker
-from views.backup_dialog import BackupDialog
+from workers.system_monitor_worker import SystemMonitorWorker
+
+# 工作线程和备份对话框在首次使用时才导入, 以加快启动
+if TYPE_CHECKING:
+    from workers.calculate_worker import CalculateWorker
+    from workers.export_worker import ExportWorker
+    from views.backup_dialog import BackupDialog
 
 # 应用程序常量
 APP_NAME = "文件夹大小扫描器"
@@ -39,7 +45,10 @@ APP_ORGANIZATION = "YourCompany"
 APP_DOMAIN = "yourcompany.com"
 
 # UI常量
-UI_UPDATE_INTERVAL = 100  # ms
+UI_UPDATE_INTERVAL = 100  # ms, 状态变化后最多延迟该时间刷新界面
+MONITOR_INTERVAL = 1.0  # 秒, 系统资源采样间隔
+STATS_UPDATE_INTERVAL = 16  # ms, 数据变化后统计信息的最小刷新间隔
+SPEED_TEXT_INTERVAL = 250  # ms, 速度标签的最小刷新间隔
 AUTOSAVE_INTERVAL = 300000  # 5分钟
 MIN_WINDOW_SIZE = QSize(900, 600)  # 更合适的最小窗口大小
 DEFAULT_BUTTON_SIZE = QSize(100, 30)  # 更紧凑的按钮大小
@@ -64,6 +73,13 @@ THEME_COLORS = {
     'text_secondary': '#64748b', # 次要文本色
 }
 
+# 工具栏和窗口使用的图标
+ICON_NAMES = ("folder", "play", "stop", "calculate", "export", "backup")
+
+# 已加载的样式表内容, 多个窗口共享
+_STYLE_SHEET_CACHE: Optional[str] = None
+
+@functools.lru_cache(maxsize=None)
 def get_resource_path(relative_path):
     """获取资源文件的绝对路径"""
     if hasattr(sys, '_MEIPASS'):
@@ -72,6 +88,20 @@ def get_resource_path(relative_path):
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
+class _OpenPathTask(QRunnable):
+    """在线程池中打开路径, 避免网络路径等阻塞界面线程"""
+    
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        
+    def run(self):
+        try:
+            if os.path.exists(self.path):
+                os.startfile(self.path)
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Error opening {self.path}: {str(e)}")
+
 class MainWindow(QMainWindow):
     """主窗口类"""
     
@@ -96,7 +126,9 @@ class MainWindow(QMainWindow):
             self.config = config
             self.logger = logging.getLogger(__name__)
             self.log_manager = LogManager()
-            self.scanner = FileScanner(config)
+            # 停止请求, 扫描器与各工作线程共享
+            self.stop_event = threading.Event()
+            self.scanner = FileScanner(config, stop_event=self.stop_event)
             
             # 错误处理器
             from utils.error_handler import ErrorHandler
@@ -105,14 +137,28 @@ class MainWindow(QMainWindow):
             # 工作线程管理
             self._workers: List[QThread] = []
             self._current_worker: Optional[QThread] = None
+            self._calc_worker: Optional[CalculateWorker] = None  # 常驻计算线程, 首次计算时创建
+            self._calc_jobs = 0  # 已提交但未完成的计算任务数
             self.current_directory: Optional[str] = None
             
-            # 性能监控
+            # 预加载图标, 创建按钮时不再访问文件系统
+            self._icons: Dict[str, QIcon] = {}
+            for name in ICON_NAMES:
+                icon_path = get_resource_path(f"resources/icons/{name}.png")
+                if os.path.exists(icon_path):
+                    self._icons[name] = QIcon(icon_path)
+            
+            # 系统资源采样线程 (psutil 调用不在界面线程执行)
+            self._system_monitor = SystemMonitorWorker(MONITOR_INTERVAL)
+            self._system_monitor.sampled.connect(self._monitor_system_resources)
+            
+            # 性能监控 (单调时钟, 不受系统时间调整影响; 单位毫秒)
+            self._ui_elapsed = QElapsedTimer()
+            self._ui_elapsed.start()
             self._performance_monitor = {
-                'last_update': time.time(),
-                'update_interval': 1.0,
-                'speed_samples': [],
-                'max_samples': 5
+                'last_update': self._ui_elapsed.elapsed(),
+                'update_interval': 1000,
+                'speed_samples': deque(maxlen=5)  # 只保留最近 5 个速度样本
             }
             
         except Exception as e:
@@ -143,15 +189,33 @@ class MainWindow(QMainWindow):
             self.file_count_label = None
             self.size_label = None
             self.speed_label = None
+            self._last_speed_text = None
+            self._last_speed_text_ms = -SPEED_TEXT_INTERVAL  # 上次刷新速度标签的时间 (_ui_elapsed 毫秒)
             self.memory_label = None
             self.cpu_label = None
             
             # 其他控件
             self.select_all_checkbox = None
             
+            # 剪贴板 (应用程序级对象, 只获取一次)
+            self._clipboard = QApplication.clipboard()
+            
+            # 右键菜单 (首次使用时创建) 及其作用的项目
+            self._ctx_menu: Optional[QMenu] = None
+            self._ctx_current_item: Optional[FileItem] = None
+            
+            # 错误对话框 (复用同一个实例)
+            self._err_dialog = QMessageBox(self)
+            self._err_dialog.setIcon(QMessageBox.Critical)
+            self._err_copy_button = self._err_dialog.addButton("复制详情", QMessageBox.ActionRole)
+            self._err_dialog.addButton(QMessageBox.Ok)
+            
             # 自动保存设置
             self._auto_save_dir = 'auto_saves'
             self._auto_save_max_files = 5
+            self._auto_save_dir_exists = False
+            self._autosave_worker: Optional[ExportWorker] = None
+            self._autosave_in_flight = False
             
         except Exception as e:
             self.logger.error(f"Error initializing components: {str(e)}")
@@ -160,11 +224,18 @@ class MainWindow(QMainWindow):
     def _init_timers(self) -> None:
         """初始化定时器"""
         try:
-            # UI更新定时器
+            # UI更新定时器 (单次触发, 仅在状态变化时启动)
             self._update_timer = QTimer(self)
+            self._update_timer.setSingleShot(True)
             self._update_timer.setInterval(UI_UPDATE_INTERVAL)
             self._update_timer.timeout.connect(self._update_ui)
             
+            # 数据变化后的统计刷新定时器 (合并突发的 dataChanged, 最多约 60 次/秒)
+            self._stats_dirty_timer = QTimer(self)
+            self._stats_dirty_timer.setSingleShot(True)
+            self._stats_dirty_timer.setInterval(STATS_UPDATE_INTERVAL)
+            self._stats_dirty_timer.timeout.connect(self._recompute_stats)
+            
             # 自动保存定时器
             self._autosave_timer = QTimer(self)
             self._autosave_timer.setInterval(AUTOSAVE_INTERVAL)
@@ -182,9 +253,8 @@ class MainWindow(QMainWindow):
             self.setMinimumSize(MIN_WINDOW_SIZE)
             
             # 设置窗口图标
-            icon_path = "resources/icons/folder.png"
-            if os.path.exists(icon_path):
-                self.setWindowIcon(QIcon(icon_path))
+            if "folder" in self._icons:
+                self.setWindowIcon(self._icons["folder"])
             
             # 设置窗口大小为屏幕大小的75%并居中
             screen = QApplication.primaryScreen().size()
@@ -214,14 +284,18 @@ class MainWindow(QMainWindow):
 
     def _setup_styles(self):
         """设置样式"""
+        global _STYLE_SHEET_CACHE
         try:
-            # 加载QSS样式文件
-            style_file = "resources/styles/main.qss"
-            if os.path.exists(style_file):
+            # 加载QSS样式文件, 只读取一次
+            if _STYLE_SHEET_CACHE is None:
+                style_file = get_resource_path("resources/styles/main.qss")
+                if not os.path.exists(style_file):
+                    self.logger.warning(f"Style file not found: {style_file}")
+                    return
                 with open(style_file, 'r', encoding='utf-8') as f:
-                    self.setStyleSheet(f.read())
-            else:
-                self.logger.warning(f"Style file not found: {style_file}")
+                    _STYLE_SHEET_CACHE = f.read()
+                    
+            self.setStyleSheet(_STYLE_SHEET_CACHE)
             
         except Exception as e:
             self.logger.error(f"Error loading styles: {str(e)}")
@@ -229,19 +303,28 @@ class MainWindow(QMainWindow):
     def _setup_shortcuts(self):
         """设置快捷键"""
         try:
-            # 文件操作快捷键
-            QShortcut(QKeySequence("Ctrl+O"), self, self.select_directory)
-            QShortcut(QKeySequence("Ctrl+S"), self, self.start_scan)
-            QShortcut(QKeySequence("Esc"), self, self.stop_scan)
-            
-            # 功能快捷键
-            QShortcut(QKeySequence("Ctrl+C"), self, self.calculate_selected)
-            QShortcut(QKeySequence("Ctrl+E"), self, self.export_to_excel)
-            QShortcut(QKeySequence("Ctrl+B"), self, self.backup_directory)
+            shortcuts = (
+                # 文件操作快捷键
+                ("Ctrl+O", self.select_directory),
+                ("Ctrl+S", self.start_scan),
+                ("Esc", self.stop_scan),
+                
+                # 功能快捷键
+                ("Ctrl+C", self.calculate_selected),
+                ("Ctrl+E", self.export_to_excel),
+                ("Ctrl+B", self.backup_directory),
+                
+                # 其他快捷键
+                ("Ctrl+A", functools.partial(self.table_model.set_all_checked, True)),
+                ("Ctrl+D", functools.partial(self.table_model.set_all_checked, False)),
+            )
             
-            # 其他快捷键
-            QShortcut(QKeySequence("Ctrl+A"), self, lambda: self.select_all_checkbox.setChecked(True))
-            QShortcut(QKeySequence("Ctrl+D"), self, lambda: self.select_all_checkbox.setChecked(False))
+            for key, slot in shortcuts:
+                action = QAction(self)
+                action.setShortcut(QKeySequence(key))
+                action.setShortcutContext(Qt.WindowShortcut)
+                action.triggered.connect(slot)
+                self.addAction(action)
             
         except Exception as e:
             self.logger.error(f"Error setting up shortcuts: {str(e)}")
@@ -250,9 +333,11 @@ class MainWindow(QMainWindow):
         """启动服务"""
         try:
             # 启动定时器
-            self._update_timer.start()
             self._autosave_timer.start()
             
+            # 启动后台系统资源采样
+            self._system_monitor.start()
+            
             # 设置状态栏初始消息
             self.status_bar.showMessage("就绪")
             
@@ -260,49 +345,37 @@ class MainWindow(QMainWindow):
             self.logger.error(f"Error starting services: {str(e)}")
             raise
 
+    def _request_ui_update(self, *args) -> None:
+        """请求刷新UI, 在 UI_UPDATE_INTERVAL 内的多次请求合并为一次"""
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+
     def _update_ui(self) -> None:
         """更新UI状态"""
-        try:
-            # 限制更新频率
-            current_time = time.time()
-            if not hasattr(self, '_last_ui_update'):
-                self._last_ui_update = 0
-            if current_time - self._last_ui_update < 0.1:
-                return
-                
-            # 更新性能统计
-            self._monitor_system_resources()
-            
-            # 更新按钮状态
-            self._update_button_states()
-            
-            # 更新状态栏
-            self._update_status_bar()
+        # 更新按钮状态
+        self._update_button_states()
+        
+        # 更新状态栏
+        self._update_status_bar()
+
+    def _monitor_system_resources(self, cpu_percent: float, memory_percent: float) -> None:
+        """处理系统资源采样结果
+        
+        Args:
+            cpu_percent: CPU使用率
+            memory_percent: 内存使用率
+        """
+        if memory_percent > 90:
+            self.logger.warning(f"High memory usage: {memory_percent}%")
             
-            self._last_ui_update = current_time
+        if cpu_percent > 90:
+            self.logger.warning(f"High CPU usage: {cpu_percent}%")
             
-        except Exception as e:
-            self.logger.error(f"Error updating UI: {str(e)}")
-
-    def _monitor_system_resources(self) -> None:
-        """监控系统资源使用情况"""
-        try:
-            # 获取内存使用情况
-            memory = psutil.virtual_memory()
-            if memory.percent > 90:
-                self.logger.warning(f"High memory usage: {memory.percent}%")
-                
-            # 获取CPU使用情况
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            if cpu_percent > 90:
-                self.logger.warning(f"High CPU usage: {cpu_percent}%")
-                
-            # 更新标签
-            self.memory_label.setText(f"内存: {memory.percent}%")
+        # 更新标签
+        if self.memory_label is not None:
+            self.memory_label.setText(f"内存: {memory_percent}%")
+        if self.cpu_label is not None:
             self.cpu_label.setText(f"CPU: {cpu_percent}%")
-            
-        except Exception as e:
-            self.logger.error(f"Error monitoring system resources: {str(e)}")
 
     def _auto_save_results(self) -> None:
         """自动保存扫描结果"""
@@ -310,39 +383,60 @@ class MainWindow(QMainWindow):
             if not self.table_model.rowCount():
                 return
                 
+            # 上一次自动保存仍在进行时跳过
+            if self._autosave_in_flight:
+                return
+                
             # 创建自动保存目录
-            if not os.path.exists(self._auto_save_dir):
-                os.makedirs(self._auto_save_dir)
+            if not self._auto_save_dir_exists:
+                os.makedirs(self._auto_save_dir, exist_ok=True)
+                self._auto_save_dir_exists = True
                 
             # 生成保存文件名
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            save_path = os.path.join(
-                self._auto_save_dir,
-                f"auto_save_{timestamp}.xlsx"
-            )
-            
-            # 导出数据
-            self.table_model.export_to_excel(save_path)
-            
-            # 清理旧的自动保存文件
-            self._cleanup_auto_saves()
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            save_path = f"{self._auto_save_dir}/auto_save_{timestamp}.xlsx"
+            
+            # 在界面线程生成快照, 由后台线程写出
+            from workers.export_worker import ExportWorker
+            worker = ExportWorker(self.table_model.get_export_rows(), save_path)
+            worker.done.connect(self._on_auto_save_finished)
+            # 线程真正退出后才允许下一次自动保存
+            worker.finished.connect(functools.partial(self._on_auto_save_thread_finished, worker))
+            self._autosave_worker = worker
+            self._autosave_in_flight = True
+            worker.start()
             
         except Exception as e:
+            self._autosave_in_flight = False
             self.logger.error(f"Error auto saving results: {str(e)}")
 
+    def _on_auto_save_finished(self, success: bool) -> None:
+        """处理自动保存完成"""
+        # 清理旧的自动保存文件
+        if success:
+            self._cleanup_auto_saves()
+
+    def _on_auto_save_thread_finished(self, worker: QThread) -> None:
+        """自动保存线程退出后释放"""
+        if self._autosave_worker is worker:
+            self._autosave_worker = None
+            self._autosave_in_flight = False
+        worker.deleteLater()
+
     def _cleanup_auto_saves(self) -> None:
         """清理旧的自动保存文件"""
         try:
-            files = sorted([
-                f for f in os.listdir(self._auto_save_dir)
-                if f.startswith("auto_save_") and f.endswith(".xlsx")
-            ], key=lambda x: os.path.getctime(
-                os.path.join(self._auto_save_dir, x)
-            ))
+            # 一次 scandir 同时取得文件名和创建时间
+            with os.scandir(self._auto_save_dir) as it:
+                entries = [
+                    (e.stat().st_ctime, e.path) for e in it
+                    if e.name.startswith("auto_save_") and e.name.endswith(".xlsx")
+                ]
+            entries.sort()
             
             # 保留最新的5个文件
-            while len(files) > self._auto_save_max_files:
-                os.remove(os.path.join(self._auto_save_dir, files.pop(0)))
+            while len(entries) > self._auto_save_max_files:
+                os.remove(entries.pop(0)[1])
                 
         except Exception as e:
             self.logger.error(f"Error cleaning up auto saves: {str(e)}")
@@ -467,8 +561,14 @@ class MainWindow(QMainWindow):
             self.table_view.setShowGrid(False)
             self.table_view.verticalHeader().setVisible(False)
             
+            # 固定行高, 布局开销与行数无关
+            vertical_header = self.table_view.verticalHeader()
+            vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+            vertical_header.setDefaultSectionSize(22)
+            
             # 设置表头
             header = self.table_view.horizontalHeader()
+            header.setResizeContentsPrecision(100)  # 自动调整列宽时只采样100行
             header.setSectionResizeMode(0, QHeaderView.Fixed)  # 复选框列
             header.setSectionResizeMode(1, QHeaderView.Interactive)  # 名称列
             header.setSectionResizeMode(2, QHeaderView.Interactive)  # 大小列
@@ -484,8 +584,14 @@ class MainWindow(QMainWindow):
             
             # 连接信号
             self.table_model.dataChanged.connect(self._on_data_changed)
+            self.table_model.rowsInserted.connect(self._request_ui_update)
+            self.table_model.modelReset.connect(self._request_ui_update)
             self.table_view.doubleClicked.connect(self._on_item_double_clicked)
             
+            # 右键菜单
+            self.table_view.setContextMenuPolicy(Qt.CustomContextMenu)
+            self.table_view.customContextMenuRequested.connect(self._show_context_menu)
+            
             layout.addWidget(self.table_view)
             return container
             
@@ -528,44 +634,25 @@ class MainWindow(QMainWindow):
         tooltip: Optional[str] = None
     ) -> QPushButton:
         """创建统一样式的按钮"""
-        try:
-            button = QPushButton(text)
-            
-            # 设置图标
-            icon_path = f"resources/icons/{icon_name}.png"
-            if os.path.exists(icon_path):
-                button.setIcon(QIcon(icon_path))
-            
-            # 设置大小和样式
-            button.setMinimumSize(DEFAULT_BUTTON_SIZE)
-            button.setCursor(Qt.PointingHandCursor)
-            
-            if tooltip:
-                button.setToolTip(tooltip)
-            
-            button.clicked.connect(slot)
-            return button
-            
-        except Exception as e:
-            self.logger.error(f"Error creating button: {str(e)}")
-            return QPushButton(text)  # 返回一个基本按钮作为后备
+        button = QPushButton(text)
+        
+        # 设置图标
+        if icon_name in self._icons:
+            button.setIcon(self._icons[icon_name])
+        
+        # 设置大小和样式
+        button.setMinimumSize(DEFAULT_BUTTON_SIZE)
+        button.setCursor(Qt.PointingHandCursor)
+        
+        if tooltip:
+            button.setToolTip(tooltip)
+        
+        button.clicked.connect(slot)
+        return button
 
     def _format_speed(self, bytes_per_second: float) -> str:
         """格式化速度显示"""
-        try:
-            units = ['B/s', 'KB/s', 'MB/s', 'GB/s']
-            speed = bytes_per_second
-            unit_index = 0
-            
-            while speed >= 1024 and unit_index < len(units) - 1:
-                speed /= 1024
-                unit_index += 1
-                
-            return f"{speed:.1f} {units[unit_index]}"
-            
-        except Exception as e:
-            self.logger.error(f"Error formatting speed: {str(e)}")
-            return "0 B/s"
+        return format_speed(bytes_per_second)
 
     def show_error(self, title: str, message: str, details: str = None):
         """显示错误对话框"""
@@ -580,23 +667,20 @@ class MainWindow(QMainWindow):
                 )
                 return
             
-            msg = QMessageBox(self)
-            msg.setIcon(QMessageBox.Critical)
+            # 对话框已在显示时只记录错误, 不嵌套弹出
+            msg = self._err_dialog
+            if msg.isVisible():
+                return
+                
             msg.setWindowTitle(title)
             msg.setText(message)
+            msg.setDetailedText(details or "")
             
-            if details:
-                msg.setDetailedText(details)
-            
-            # 添加复制按钮
-            copy_button = msg.addButton("复制详情", QMessageBox.ActionRole)
-            msg.addButton(QMessageBox.Ok)
-            
-            result = msg.exec_()
+            msg.exec_()
             
             # 处理复制按钮点击
-            if msg.clickedButton() == copy_button and details:
-                QApplication.clipboard().setText(details)
+            if msg.clickedButton() == self._err_copy_button and details:
+                self._clipboard.setText(details)
                 self.status_bar.showMessage("错误详情已复制到剪贴板", 3000)
             
         except Exception as e:
@@ -637,7 +721,7 @@ class MainWindow(QMainWindow):
         """浏览并选择目录"""
         try:
             # 获取上次的目录
-            last_dir = self.config.get_setting('last_directory', os.path.expanduser('~'))
+            last_dir = self.config.get_setting('last_directory', HOME_DIR)
             
             # 打开目录选择对话框
             path = QFileDialog.getExistingDirectory(
@@ -667,12 +751,14 @@ class MainWindow(QMainWindow):
             self.table_model.clear()
             
             # 创建扫描工作线程
-            worker = ScanWorker(self.scanner, path)
-            worker.file_found.connect(self.table_model.add_item)
-            worker.finished.connect(lambda success: self._on_scan_finished(success))
+            from workers.scan_worker import ScanWorker
+            worker = ScanWorker(self.scanner, path, stop_event=self.stop_event)
+            worker.files_found_batch.connect(self.table_model.add_items)
+            worker.done.connect(lambda success: self._on_scan_finished(success))
             worker.error.connect(self.show_error)
             
-            # 开始扫描
+            # 开始扫描, 停止请求在界面线程清除
+            self.stop_event.clear()
             self._start_worker(worker)
             
             # 更新UI状态
@@ -695,12 +781,10 @@ class MainWindow(QMainWindow):
                 self._current_worker.quit()
                 self._current_worker.wait()
             
-            # 设置新的工作线程
+            # 设置新的工作线程, 线程结束后自动移除并释放
             self._current_worker = worker
             self._workers.append(worker)
-            
-            # 清理已完成的工作线程
-            self._cleanup_workers()
+            worker.finished.connect(functools.partial(self._on_worker_thread_finished, worker))
             
             # 更新UI状态
             self._update_button_states(scanning=True)
@@ -712,16 +796,13 @@ class MainWindow(QMainWindow):
             self.logger.error(f"Error starting worker: {str(e)}")
             self.show_error("线程错误", f"启动工作线程失败: {str(e)}")
 
-    def _cleanup_workers(self) -> None:
-        """清理已完成的工作线程"""
-        try:
-            # 移除已完成的线程
-            self._workers = [
-                worker for worker in self._workers 
-                if worker.isRunning()
-            ]
-        except Exception as e:
-            self.logger.error(f"Error cleaning up workers: {str(e)}")
+    def _on_worker_thread_finished(self, worker: QThread) -> None:
+        """工作线程退出后移除并释放 (连接 QThread.finished, 而不是在 run() 内发出的 done)"""
+        if worker in self._workers:
+            self._workers.remove(worker)
+        if self._current_worker is worker:
+            self._current_worker = None
+        worker.deleteLater()
 
     def _on_scan_finished(self, success: bool):
         """处理扫描完成"""
@@ -746,10 +827,6 @@ class MainWindow(QMainWindow):
                 )
                 self.status_bar.showMessage(status_text)
                 
-                # 更新表格显示
-                self.table_view.resizeColumnsToContents()
-                self.table_view.resizeRowsToContents()
-                
                 # 自动保存结果
                 self._auto_save_results()
             else:
@@ -774,8 +851,12 @@ class MainWindow(QMainWindow):
     def stop_scan(self):
         """停止当前操作"""
         try:
-            # 停止扫描器
-            self.scanner.stop()
+            # 先丢弃排队中的计算任务, 否则计算线程可能取出下一个任务并清除停止请求
+            if self._calc_worker is not None:
+                self._calc_jobs -= self._calc_worker.cancel_pending()
+                
+            # 通知扫描器和工作线程停止, 正在进行的计算任务随之结束
+            self.stop_event.set()
             
             # 停止当前工作线程
             if self._current_worker and self._current_worker.isRunning():
@@ -798,14 +879,8 @@ class MainWindow(QMainWindow):
                 self.show_error("计算错误", "请先选择要计算的文件夹")
                 return
                 
-            # 创建计算工作线程
-            worker = CalculateWorker(self.scanner, items)
-            worker.progress.connect(self._on_calculate_progress)
-            worker.finished.connect(lambda: self._on_calculate_finished())
-            worker.error.connect(self.show_error)
-            
-            # 开始计算
-            self._start_worker(worker)
+            # 提交到常驻的计算线程
+            self._submit_calculation(items)
             
             # 更新UI状态
             self.progress_bar.setVisible(True)
@@ -816,6 +891,25 @@ class MainWindow(QMainWindow):
             self.logger.error(f"Error calculating sizes: {str(e)}")
             self.show_error("计算错误", str(e))
 
+    def _submit_calculation(self, items: List[FileItem]) -> None:
+        """提交计算任务, 首次使用时创建常驻的计算线程"""
+        if self._calc_worker is None:
+            from workers.calculate_worker import CalculateWorker
+            worker = CalculateWorker(self.scanner, stop_event=self.stop_event)
+            worker.items_calculated.connect(self.table_model.update_items)
+            worker.progress.connect(self._on_calculate_progress)
+            worker.progress.connect(self._request_ui_update)
+            worker.done.connect(self._on_calculate_finished)
+            worker.error.connect(self.show_error)
+            worker.start()
+            self._calc_worker = worker
+            
+        # 在界面线程清除上一次的停止请求, 计算线程不会清除, 之后的停止不会丢失
+        self.stop_event.clear()
+        self._calc_jobs += 1
+        self._calc_worker.submit(items)
+        self._update_button_states(scanning=True)
+
     def export_to_excel(self):
         """导出到Excel"""
         try:
@@ -828,7 +922,7 @@ class MainWindow(QMainWindow):
             file_path, _ = QFileDialog.getSaveFileName(
                 self,
                 "导出Excel",
-                os.path.join(os.path.expanduser("~"), "扫描结果.xlsx"),
+                os.path.join(get_documents_dir(), "扫描结果.xlsx"),
                 "Excel Files (*.xlsx)"
             )
             
@@ -852,28 +946,50 @@ class MainWindow(QMainWindow):
                 return
                 
             # 创建备份对话框
+            from views.backup_dialog import BackupDialog
             dialog = BackupDialog(self)
-            dialog.backup_started.connect(lambda dest_path: self._start_backup(items, dest_path))
+            dialog.backup_started.connect(
+                lambda dest_path: self._start_backup(items, dest_path, dialog)
+            )
             dialog.exec_()
             
         except Exception as e:
             self.logger.error(f"Error backing up directories: {str(e)}")
             self.show_error("备份错误", str(e))
 
-    def _start_backup(self, items: List[FileItem], dest_path: str):
-        """开始备份操作"""
+    def _start_backup(
+        self,
+        items: List[FileItem],
+        dest_path: str,
+        dialog: Optional[BackupDialog] = None
+    ):
+        """开始备份操作
+        
+        Args:
+            items: 要备份的项目
+            dest_path: 目标路径
+            dialog: 显示备份进度的对话框
+        """
         try:
             # 创建备份工作线程
+            from workers.backup_worker import BackupWorker
             worker = BackupWorker(
                 self.scanner,
                 [item.path for item in items],
-                dest_path
+                dest_path,
+                stop_event=self.stop_event
             )
             worker.progress.connect(self._on_backup_progress)
-            worker.finished.connect(self._on_backup_finished)
+            worker.done.connect(self._on_backup_finished)
             worker.error.connect(self.show_error)
             
-            # 开始备份
+            # 对话框在备份期间保持可响应, 进度通过排队信号更新
+            if dialog is not None:
+                worker.progress.connect(dialog.update_progress, Qt.QueuedConnection)
+                worker.done.connect(dialog.backup_finished, Qt.QueuedConnection)
+            
+            # 开始备份, 停止请求在界面线程清除
+            self.stop_event.clear()
             self._start_worker(worker)
             
             # 更新UI状态
@@ -886,52 +1002,50 @@ class MainWindow(QMainWindow):
             self.show_error("备份错误", str(e))
 
     def _on_calculate_progress(self, item: FileItem, current: int, total: int, speed: float):
-        """处理计算进度"""
-        try:
-            # 更新进度条
-            progress = int(current * 100 / total)
+        """处理计算进度 (工作线程已按时间间隔采样)"""
+        # 更新进度条
+        progress = current * 100 // total if total else 0
+        if progress != self.progress_bar.value():
             self.progress_bar.setValue(progress)
-            
-            # 更新状态栏
-            self.status_bar.showMessage(
-                f"正在计算: {item.name} ({current}/{total})"
-            )
-            
-            # 更新速度标签
-            self.speed_label.setText(f"速度: {speed:.1f} 项/秒")
-            
-        except Exception as e:
-            self.logger.error(f"Error updating calculate progress: {str(e)}")
+        
+        # 更新状态栏
+        self._show_status(f"正在计算: {item.name} ({current}/{total})")
+        
+        # 更新速度标签 (限频, 避免每次进度都格式化)
+        if self._speed_text_due():
+            self._set_speed_text(f"速度: {speed:.1f} 项/秒")
 
     def _on_calculate_finished(self):
         """处理计算完成"""
         try:
+            self._calc_jobs -= 1
+            
+            # 还有排队的任务时保持进度显示
+            if self._calc_jobs > 0:
+                return
+                
             # 更新UI状态
             self.progress_bar.setVisible(False)
             self._update_button_states(scanning=False)
             self.status_bar.showMessage("计算完成")
-            self.speed_label.setText("速度: 0 项/秒")
+            self._set_speed_text("速度: 0 项/秒")
             
         except Exception as e:
             self.logger.error(f"Error handling calculate finished: {str(e)}")
 
-    def _on_backup_progress(self, current_file: str, current: int, total: int, speed: float, total_bytes: int):
-        """处理备份进度"""
-        try:
-            # 更新进度条
-            progress = int(current * 100 / total)
+    def _on_backup_progress(self, file_name: str, current: int, total: int, speed: float, total_bytes: int):
+        """处理备份进度 (工作线程已按时间间隔采样)"""
+        # 更新进度条
+        progress = current * 100 // total if total else 0
+        if progress != self.progress_bar.value():
             self.progress_bar.setValue(progress)
-            
-            # 更新状态栏
-            self.status_bar.showMessage(
-                f"正在备份: {os.path.basename(current_file)} ({current}/{total})"
-            )
-            
-            # 更新速度标签
-            self.speed_label.setText(f"速度: {self._format_speed(speed)}")
-            
-        except Exception as e:
-            self.logger.error(f"Error updating backup progress: {str(e)}")
+        
+        # 更新状态栏
+        self._show_status(f"正在备份: {file_name} ({current}/{total})")
+        
+        # 更新速度标签 (限频, 避免每次进度都格式化)
+        if self._speed_text_due():
+            self._set_speed_text(f"速度: {self._format_speed(speed)}")
 
     def _on_backup_finished(self, success: bool):
         """处理备份完成"""
@@ -945,19 +1059,44 @@ class MainWindow(QMainWindow):
             else:
                 self.status_bar.showMessage("备份已取消")
                 
-            self.speed_label.setText("速度: 0 B/s")
+            self._set_speed_text("速度: 0 B/s")
             
         except Exception as e:
             self.logger.error(f"Error handling backup finished: {str(e)}")
 
+    def _show_status(self, text: str) -> None:
+        """显示状态栏消息, 与当前消息相同时跳过"""
+        if self.status_bar.currentMessage() != text:
+            self.status_bar.showMessage(text)
+
+    def _speed_text_due(self) -> bool:
+        """速度标签是否需要刷新, 最多每 SPEED_TEXT_INTERVAL 毫秒一次"""
+        if self.speed_label is None:
+            return False
+        now = self._ui_elapsed.elapsed()
+        if now - self._last_speed_text_ms < SPEED_TEXT_INTERVAL:
+            return False
+        self._last_speed_text_ms = now
+        return True
+
+    def _set_speed_text(self, text: str) -> None:
+        """更新速度标签, 文本未变化时跳过"""
+        if self.speed_label is None or text == self._last_speed_text:
+            return
+        self._last_speed_text = text
+        self.speed_label.setText(text)
+
     def _update_select_all_state(self) -> None:
         """更新全选复选框状态"""
         try:
+            if self.select_all_checkbox is None:
+                return
+                
             if not self.table_model.rowCount():
                 self.select_all_checkbox.setChecked(False)
                 return
                 
-            checked_count = len(self.table_model.get_checked_items())
+            checked_count = self.table_model.checked_count()
             total_count = self.table_model.rowCount()
             
             if checked_count == 0:
@@ -972,11 +1111,24 @@ class MainWindow(QMainWindow):
         except Exception as e:
             self.logger.error(f"Error updating select all state: {str(e)}")
 
-    def _update_button_states(self, scanning: bool = False) -> None:
-        """更新按钮状态"""
+    def _is_busy(self) -> bool:
+        """是否有工作线程正在运行"""
+        if self._calc_jobs > 0:
+            return True
+        return self._current_worker is not None and self._current_worker.isRunning()
+
+    def _update_button_states(self, scanning: Optional[bool] = None) -> None:
+        """更新按钮状态
+        
+        Args:
+            scanning: 是否处于扫描/计算/备份中, 默认根据当前工作线程判断
+        """
         try:
+            if scanning is None:
+                scanning = self._is_busy()
+                
             has_items = bool(self.table_model.rowCount())
-            has_checked = bool(self.table_model.get_checked_items())
+            has_checked = self.table_model.checked_count() > 0
             
             # 更新扫描相关按钮
             self.select_btn.setEnabled(not scanning)
@@ -992,30 +1144,31 @@ class MainWindow(QMainWindow):
 
     def _update_status_bar(self) -> None:
         """更新状态栏"""
-        try:
-            total_items = self.table_model.rowCount()
-            if total_items > 0:
-                total_size, size_formatted = self.table_model.get_total_size()
-                total_files = self.table_model.get_total_files()
-                
-                status_text = (
-                    f"总文件夹: {total_items:,} | "
-                    f"总文件数: {total_files:,} | "
-                    f"总大小: {size_formatted}"
-                )
-                
-                if self.current_directory:
-                    status_text += f" | 当前目录: {self.current_directory}"
-                    
-                self.status_bar.showMessage(status_text)
-                
-                # 更新标签
-                self.folder_count_label.setText(f"文件夹: {total_items:,}")
-                self.file_count_label.setText(f"文件数: {total_files:,}")
-                self.size_label.setText(f"总大小: {size_formatted}")
-                
-        except Exception as e:
-            self.logger.error(f"Error updating status bar: {str(e)}")
+        total_items = self.table_model.rowCount()
+        if total_items <= 0:
+            return
+            
+        # 状态栏隐藏且统计标签未创建时无需生成文本
+        status_visible = self.status_bar.isVisible()
+        if not status_visible and self.folder_count_label is None:
+            return
+            
+        # 数字只格式化一次, 状态栏和标签共用
+        folders = f"{total_items:,}"
+        files = f"{self.table_model.get_total_files():,}"
+        size_text = f"总大小: {self.table_model.get_total_size()[1]}"
+        
+        if status_visible:
+            parts = [f"总文件夹: {folders}", f"总文件数: {files}", size_text]
+            if self.current_directory:
+                parts.append(f"当前目录: {self.current_directory}")
+            self._show_status(" | ".join(parts))
+            
+        # 更新标签
+        if self.folder_count_label is not None:
+            self.folder_count_label.setText(f"文件夹: {folders}")
+            self.file_count_label.setText(f"文件数: {files}")
+            self.size_label.setText(size_text)
 
     def _on_select_all_changed(self, state):
         """处理全选状态变化
@@ -1024,18 +1177,9 @@ class MainWindow(QMainWindow):
             state: Qt.CheckState 状态值
         """
         try:
-            # 开始批量更新
-            self.table_model.beginResetModel()
-            
-            # 更新所有项的选中状态
-            for item in self.table_model._data:
-                item.checked = bool(state == Qt.Checked)
-            
-            # 结束批量更新
-            self.table_model.endResetModel()
-            
-            # 更新按钮状态
-            self._update_button_states()
+            # 只通知复选框列变化, 不重置整个模型;
+            # 按钮和状态栏由 dataChanged 触发的延迟刷新更新
+            self.table_model.set_all_checked(state == Qt.Checked)
             
         except Exception as e:
             self.logger.error(f"Error handling select all change: {str(e)}")
@@ -1048,6 +1192,12 @@ class MainWindow(QMainWindow):
             bottomRight: 右下角索引
             roles: 改变的角色列表
         """
+        # 定时器已启动时不重新计时, 持续的变化也能按间隔刷新
+        if not self._stats_dirty_timer.isActive():
+            self._stats_dirty_timer.start()
+
+    def _recompute_stats(self) -> None:
+        """数据变化后刷新统计相关的界面状态"""
         try:
             # 更新全选状态
             self._update_select_all_state()
@@ -1067,68 +1217,99 @@ class MainWindow(QMainWindow):
         Args:
             index: 项目索引
         """
-        try:
-            if not index.isValid():
-                return
-            
-            item = self.table_model.get_item(index.row())
-            if item and os.path.exists(item.path):
-                os.startfile(item.path)
-            
-        except Exception as e:
-            self.logger.error(f"Error handling item double click: {str(e)}")
+        if not index.isValid():
+            return
+        
+        item = self.table_model.get_item(index.row())
+        if item:
+            self._open_path_async(item.path)
+
+    def _open_path_async(self, path: str) -> None:
+        """在后台线程中打开路径 (路径检查也在后台进行)"""
+        QThreadPool.globalInstance().start(_OpenPathTask(path))
 
     def _center_window(self):
         """将窗口居中显示"""
-        try:
-            # 获取屏幕几何信息
-            screen = QApplication.primaryScreen().geometry()
-            # 获取窗口几何信息
-            window = self.geometry()
-            # 计算居中位置
-            x = (screen.width() - window.width()) // 2
-            y = (screen.height() - window.height()) // 2
-            # 移动窗口
-            self.move(x, y)
-        except Exception as e:
-            self.logger.error(f"Error centering window: {str(e)}")
+        # 获取屏幕几何信息
+        screen = QApplication.primaryScreen().geometry()
+        # 获取窗口几何信息
+        window = self.geometry()
+        # 计算居中位置
+        x = (screen.width() - window.width()) // 2
+        y = (screen.height() - window.height()) // 2
+        # 移动窗口
+        self.move(x, y)
 
     def _show_context_menu(self, pos):
         """显示右键菜单"""
+        # 获取点击位置的项目
+        index = self.table_view.indexAt(pos)
+        if not index.isValid():
+            return
+        
+        item = self.table_model.get_item(index.row())
+        if not item:
+            return
+        
+        # 菜单只创建一次, 动作作用于当前右键的项目
+        if self._ctx_menu is None:
+            self._ctx_menu = self._create_context_menu()
+        self._ctx_current_item = item
+        
+        # 显示菜单 (exec_ 返回时动作已执行), 之后不再持有该项目
+        self._ctx_menu.exec_(self.table_view.viewport().mapToGlobal(pos))
+        self._ctx_current_item = None
+
+    def _create_context_menu(self) -> QMenu:
+        """创建右键菜单"""
+        menu = QMenu(self)
+        
+        # 添加菜单项
+        menu.addAction("打开文件夹").triggered.connect(self._ctx_open_folder)
+        menu.addAction("复制路径").triggered.connect(self._ctx_copy_path)
+        
+        menu.addSeparator()
+        
+        menu.addAction("计算大小").triggered.connect(self._ctx_calculate)
+        
+        # 目录大小缓存: 默认关闭, 文件原地修改后缓存的大小可能过期
+        cache_action = menu.addAction("使用大小缓存")
+        cache_action.setCheckable(True)
+        cache_action.setChecked(self.scanner.size_cache_enabled)
+        cache_action.toggled.connect(self._set_size_cache_enabled)
+        menu.addAction("清除大小缓存").triggered.connect(self._clear_size_cache)
+        
+        return menu
+
+    def _ctx_open_folder(self):
+        """右键菜单: 打开文件夹"""
+        if self._ctx_current_item is not None:
+            self._open_path_async(self._ctx_current_item.path)
+
+    def _ctx_copy_path(self):
+        """右键菜单: 复制路径"""
+        if self._ctx_current_item is not None:
+            self._clipboard.setText(self._ctx_current_item.path)
+
+    def _ctx_calculate(self):
+        """右键菜单: 计算大小"""
+        if self._ctx_current_item is not None:
+            self._calculate_single_item(self._ctx_current_item)
+
+    def _set_size_cache_enabled(self, enabled: bool):
+        """启用或关闭目录大小缓存"""
+        self.scanner.size_cache_enabled = enabled
+        self.config.set_setting('size_cache_enabled', enabled)
+        self.config.schedule_save()
+
+    def _clear_size_cache(self):
+        """清除目录大小缓存, 之后的计算重新读取所有目录"""
         try:
-            # 获取点击位置的项目
-            index = self.table_view.indexAt(pos)
-            if not index.isValid():
-                return
-            
-            item = self.table_model.get_item(index.row())
-            if not item:
-                return
-            
-            # 创建菜单
-            menu = QMenu(self)
-            
-            # 添加菜单项
-            open_action = menu.addAction("打开文件夹")
-            open_action.triggered.connect(lambda: os.startfile(item.path))
-            
-            copy_path_action = menu.addAction("复制路径")
-            copy_path_action.triggered.connect(
-                lambda: QApplication.clipboard().setText(item.path)
-            )
-            
-            menu.addSeparator()
-            
-            calculate_action = menu.addAction("计算大小")
-            calculate_action.triggered.connect(
-                lambda: self._calculate_single_item(item)
-            )
-            
-            # 显示菜单
-            menu.exec_(self.table_view.viewport().mapToGlobal(pos))
-            
+            self.scanner.clear_size_cache()
+            self.status_bar.showMessage("已清除大小缓存", 3000)
         except Exception as e:
-            self.logger.error(f"Error showing context menu: {str(e)}")
+            self.logger.error(f"Error clearing size cache: {str(e)}")
+            self.show_error("错误", str(e))
 
     def _calculate_single_item(self, item: FileItem):
         """计算单个项目的大小
@@ -1137,14 +1318,8 @@ class MainWindow(QMainWindow):
             item: 要计算的文件项目
         """
         try:
-            # 创建计算工作线程
-            worker = CalculateWorker(self.scanner, [item])
-            worker.progress.connect(self._on_calculate_progress)
-            worker.finished.connect(lambda: self._on_calculate_finished())
-            worker.error.connect(self.show_error)
-            
-            # 开始计算
-            self._start_worker(worker)
+            # 提交到常驻的计算线程
+            self._submit_calculation([item])
             
             # 更新UI状态
             self.progress_bar.setVisible(True)
@@ -1155,6 +1330,35 @@ class MainWindow(QMainWindow):
             self.logger.error(f"Error calculating single item: {str(e)}")
             self.show_error("计算错误", str(e))
 
+    def closeEvent(self, event):
+        """处理窗口关闭事件"""
+        self._system_monitor.stop()
+        self._system_monitor.wait()
+        
+        # 先丢弃排队的计算任务, 再请求所有操作停止
+        if self._calc_worker is not None:
+            self._calc_worker.cancel_pending()
+        self.stop_event.set()
+        
+        # 等待扫描/备份线程退出, 窗口销毁前不再有线程访问界面对象
+        for worker in list(self._workers):
+            worker.quit()
+            worker.wait()
+        
+        # 结束常驻的计算线程
+        if self._calc_worker is not None:
+            self._calc_worker.shutdown()
+            self._calc_worker.wait()
+        
+        # 计算已结束, 释放扫描器的遍历线程池
+        self.scanner.close()
+        
+        # 等待正在写入的自动保存完成
+        if self._autosave_worker is not None:
+            self._autosave_worker.wait()
+            
+        super().closeEvent(event)
+
     def dragEnterEvent(self, event):
         """处理拖入事件"""
         if event.mimeData().hasUrls():
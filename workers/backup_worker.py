@@ -1,27 +1,58 @@
 from PyQt5.QtCore import QThread, pyqtSignal
+import os
 import logging
+import threading
 import time
-from typing import List
+from typing import List, Optional
+
+PROGRESS_INTERVAL = 0.1  # 秒, 进度信号的最小发送间隔
 
 class BackupWorker(QThread):
     """备份工作线程"""
     
-    progress = pyqtSignal(str, int, int, float, int)  # 当前文件, 当前数量, 总数量, 速度, 总字节数
-    finished = pyqtSignal(bool)  # 是否成功完成
+    progress = pyqtSignal(str, int, int, float, int)  # 当前文件名, 当前数量, 总数量, 速度, 总字节数
+    done = pyqtSignal(bool)  # 是否成功完成
     error = pyqtSignal(str, str)  # 错误标题, 错误消息
     
-    def __init__(self, scanner, src_paths: List[str], dest_path: str):
+    def __init__(
+        self,
+        scanner,
+        src_paths: List[str],
+        dest_path: str,
+        stop_event: Optional[threading.Event] = None
+    ):
         super().__init__()
         self.scanner = scanner
+        self.stop_event = stop_event if stop_event is not None else scanner.stop_event
         self.src_paths = src_paths
         self.dest_path = dest_path
         self.logger = logging.getLogger(__name__)
         
+    def _emit_progress(self, current_file: str, current: int, total: int, speed: float):
+        """发送进度信号"""
+        # 在工作线程中取文件名, 界面线程直接显示
+        self.progress.emit(os.path.basename(current_file), current, total, speed, 0)
+        
     def run(self):
         """运行备份任务"""
         try:
+            last_emit = 0.0
+            pending = None  # 被节流跳过的最近一次进度
+            
             def progress_callback(current_file, current, total, speed):
-                self.progress.emit(current_file, current, total, speed, 0)
+                nonlocal last_emit, pending
+                # 已请求停止时不再报告进度, 复制循环随后中止
+                if self.stop_event.is_set():
+                    return
+                    
+                # 按时间间隔采样发送进度, 跳过的进度在备份结束后补发
+                pending = (current_file, current, total, speed)
+                now = time.monotonic()
+                if now - last_emit < PROGRESS_INTERVAL:
+                    return
+                last_emit = now
+                self._emit_progress(*pending)
+                pending = None
                 
             success = self.scanner.backup_directories(
                 self.src_paths,
@@ -29,9 +60,13 @@ class BackupWorker(QThread):
                 progress_callback
             )
             
-            self.finished.emit(success)
+            # 发送最终进度, 界面显示最后复制的文件
+            if pending is not None:
+                self._emit_progress(*pending)
+                
+            self.done.emit(success)
             
         except Exception as e:
             self.logger.error(f"Error in backup worker: {str(e)}")
             self.error.emit("备份错误", str(e))
-            self.finished.emit(False) 
\ No newline at end of file
+            self.done.emit(False) 
\ No newline at end of file
@@ -1,41 +1,125 @@
 from PyQt5.QtCore import QThread, pyqtSignal
 import logging
+import queue
+import threading
 import time
-from typing import List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator, List, Optional
 from models.file_item import FileItem
 
+PROGRESS_INTERVAL = 0.1  # 秒, 进度信号的最小发送间隔
+
+# 同时计算的项目数 (配置项 max_calc_threads)。单块机械硬盘上并行只会增加寻道,
+# 默认逐个计算; SSD 或网络共享可以调大。每个项目内部的遍历本身已是多线程。
+DEFAULT_CALC_THREADS = 1
+
 class CalculateWorker(QThread):
-    """计算大小工作线程"""
+    """计算大小工作线程
+    
+    线程常驻, 通过 submit() 接收计算任务并依次处理, shutdown() 后退出。
+    """
     
     progress = pyqtSignal(FileItem, int, int, float)  # 当前项目, 当前数量, 总数量, 速度
-    finished = pyqtSignal()
+    items_calculated = pyqtSignal(list)  # 自上次进度信号以来计算完成的项目
+    done = pyqtSignal()  # 一个任务处理完成; 线程常驻, 不会随之退出
     error = pyqtSignal(str, str)  # 错误标题, 错误消息
     
-    def __init__(self, scanner, items: List[FileItem]):
+    def __init__(self, scanner, stop_event: Optional[threading.Event] = None):
         super().__init__()
         self.scanner = scanner
-        self.items = items
+        self.stop_event = stop_event if stop_event is not None else scanner.stop_event
         self.logger = logging.getLogger(__name__)
+        self._queue = queue.Queue()
+        
+    def submit(self, items: List[FileItem]):
+        """提交一个计算任务
+        
+        停止请求由调用方在提交前清除, 本线程只读取, 不会覆盖刚发出的停止。
+        """
+        self._queue.put(list(items))
+        
+    def cancel_pending(self) -> int:
+        """丢弃尚未开始的任务
+        
+        Returns:
+            int: 丢弃的任务数
+        """
+        count = 0
+        while True:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                return count
+            if job is None:
+                # 保留退出标记
+                self._queue.put(None)
+                return count
+            count += 1
+            
+    def shutdown(self):
+        """处理完已提交的任务后退出线程"""
+        self._queue.put(None)
         
     def run(self):
         """运行计算任务"""
-        try:
-            total = len(self.items)
-            for i, item in enumerate(self.items, 1):
-                if self.scanner.stopped:
-                    break
-                    
-                start_time = time.time()
-                self.scanner.calculate_directory_info(item)
-                elapsed = time.time() - start_time
+        while True:
+            items = self._queue.get()
+            if items is None:
+                break
                 
-                # 计算速度 (items/s)
-                speed = 1.0 / elapsed if elapsed > 0 else 0
+            try:
+                self._calculate(items)
+            except Exception as e:
+                self.logger.error(f"Error in calculate worker: {str(e)}")
+                self.error.emit("计算错误", str(e))
+            finally:
+                self.done.emit()
                 
+    def _calculate(self, items: List[FileItem]):
+        """计算一个任务中的所有项目"""
+        total = len(items)
+        done: List[FileItem] = []
+        last_emit = time.monotonic()
+        for i, item in enumerate(self._iter_calculated(items), 1):
+            done.append(item)
+            
+            # 按时间间隔采样发送进度, 最后一项总是发送
+            now = time.monotonic()
+            elapsed = now - last_emit
+            if elapsed >= PROGRESS_INTERVAL or i == total:
+                # 计算窗口内的平均速度 (items/s)
+                speed = len(done) / elapsed if elapsed > 0 else 0.0
+                self.items_calculated.emit(done)
                 self.progress.emit(item, i, total, speed)
+                done = []
+                last_emit = now
                 
-            self.finished.emit()
+        # 停止时发送尚未通知的项目
+        if done:
+            self.items_calculated.emit(done)
+            
+        # 每个任务结束后写出一次目录大小缓存 (只含完整读取的目录)
+        self.scanner.save_size_cache()
+            
+    def _iter_calculated(self, items: List[FileItem]) -> Iterator[FileItem]:
+        """计算项目并按完成顺序返回, 停止后不再开始新的项目"""
+        max_threads = max(1, int(self.scanner.config.get_setting('max_calc_threads', DEFAULT_CALC_THREADS)))
+        if max_threads == 1 or len(items) == 1:
+            for item in items:
+                if self.stop_event.is_set():
+                    return
+                yield self.scanner.calculate_directory_info(item)
+            return
+            
+        def calculate(item: FileItem):
+            if self.stop_event.is_set():
+                return None
+            return self.scanner.calculate_directory_info(item)
             
-        except Exception as e:
-            self.logger.error(f"Error in calculate worker: {str(e)}")
-            self.error.emit("计算错误", str(e)) 
\ No newline at end of file
+        # 完成结果只在本线程中消费, 计数无需加锁
+        with ThreadPoolExecutor(max_workers=min(max_threads, len(items))) as executor:
+            futures = [executor.submit(calculate, item) for item in items]
+            for future in as_completed(futures):
+                item = future.result()
+                if item is not None:
+                    yield item
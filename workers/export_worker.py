@@ -0,0 +1,25 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+import logging
+from typing import List
+from viewmodels.main_viewmodel import FileTableModel
+
+class ExportWorker(QThread):
+    """导出工作线程"""
+    
+    done = pyqtSignal(bool)  # 是否成功完成
+    
+    def __init__(self, rows: List[tuple], save_path: str):
+        super().__init__()
+        self.rows = rows  # 在界面线程生成的数据快照
+        self.save_path = save_path
+        self.logger = logging.getLogger(__name__)
+        
+    def run(self):
+        """运行导出任务"""
+        try:
+            FileTableModel.write_excel(self.save_path, self.rows)
+            self.done.emit(True)
+            
+        except Exception as e:
+            self.logger.error(f"Error in export worker: {str(e)}")
+            self.done.emit(False)
@@ -1,31 +1,54 @@
 from PyQt5.QtCore import QThread, pyqtSignal
 import logging
-from models.file_item import FileItem
+import threading
+import time
+from typing import Optional
+
+# 批量发送扫描结果的阈值
+BATCH_SIZE = 256
+BATCH_INTERVAL = 0.05  # 秒
 
 class ScanWorker(QThread):
     """扫描工作线程"""
     
-    file_found = pyqtSignal(FileItem)  # 发现文件项
-    finished = pyqtSignal(bool)  # 是否成功完成
+    files_found_batch = pyqtSignal(list)  # 发现的一批文件项
+    done = pyqtSignal(bool)  # 是否成功完成
     error = pyqtSignal(str, str)  # 错误标题, 错误消息
     
-    def __init__(self, scanner, path: str):
+    def __init__(self, scanner, path: str, stop_event: Optional[threading.Event] = None):
         super().__init__()
         self.scanner = scanner
         self.path = path
+        self.stop_event = stop_event if stop_event is not None else scanner.stop_event
         self.logger = logging.getLogger(__name__)
+        self._buf = []
+        self._last_flush = time.monotonic()
+        
+    def _flush(self):
+        """发送缓冲的文件项"""
+        if self._buf:
+            self.files_found_batch.emit(self._buf)
+            self._buf = []
+        self._last_flush = time.monotonic()
         
     def run(self):
         """运行扫描任务"""
         try:
             for item in self.scanner.scan_directory(self.path):
-                if self.scanner.stopped:
+                if self.stop_event.is_set():
                     break
-                self.file_found.emit(item)
-                
-            self.finished.emit(not self.scanner.stopped)
+                    
+                # 合并为批次发送, 减少跨线程信号和视图重排
+                self._buf.append(item)
+                if (len(self._buf) >= BATCH_SIZE
+                        or time.monotonic() - self._last_flush > BATCH_INTERVAL):
+                    self._flush()
+                    
+            self._flush()
+            self.done.emit(not self.stop_event.is_set())
             
         except Exception as e:
+            self._flush()
             self.logger.error(f"Error in scan worker: {str(e)}")
             self.error.emit("扫描错误", str(e))
-            self.finished.emit(False) 
\ No newline at end of file
+            self.done.emit(False)
@@ -0,0 +1,35 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+import logging
+import threading
+
+class SystemMonitorWorker(QThread):
+    """系统资源监控线程"""
+    
+    sampled = pyqtSignal(float, float)  # CPU使用率, 内存使用率
+    
+    def __init__(self, interval: float = 1.0):
+        super().__init__()
+        self.interval = interval
+        self.logger = logging.getLogger(__name__)
+        self._stop_event = threading.Event()
+        
+    def stop(self):
+        """停止监控"""
+        self._stop_event.set()
+        
+    def run(self):
+        """运行监控任务"""
+        try:
+            # 在监控线程中导入, 避免拖慢启动
+            import psutil
+            
+            # interval=None 为非阻塞模式, 返回距上次调用期间的平均值, 首次调用仅用于初始化
+            psutil.cpu_percent(interval=None)
+            
+            while not self._stop_event.wait(self.interval):
+                cpu_percent = psutil.cpu_percent(interval=None)
+                memory = psutil.virtual_memory()
+                self.sampled.emit(cpu_percent, memory.percent)
+                
+        except Exception as e:
+            self.logger.error(f"Error in system monitor worker: {str(e)}")